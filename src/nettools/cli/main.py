@@ -1,17 +1,24 @@
 """Main CLI application entry point."""
 
 import json
+import sys
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from nettools.core.iperf3 import IPerf3Wrapper
-from nettools.core.ping import PingWrapper
-from nettools.core.ports import PortChecker
-from nettools.core.sysinfo import SystemInfo
 from nettools.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_ORJSON = False
+
 app = typer.Typer(
     name="nettools",
     help="Cross-platform CLI automation suite for network and system tools",
@@ -21,6 +28,9 @@ app = typer.Typer(
 console = Console()
 logger = get_logger()
 
+# Column layout shared by the two-column "Metric | Value" tables
+_METRIC_VALUE_COLUMNS = (("Metric", "cyan"), ("Value", "green"))
+
 
 @app.command("iperf3-run")
 def iperf3_run(
@@ -32,10 +42,23 @@ def iperf3_run(
     duration: int = typer.Option(
         10, "--duration", "-t", help="Test duration in seconds"
     ),
+    parallel: int = typer.Option(
+        1, "--parallel", "-P", help="Number of parallel client streams"
+    ),
+    reverse: bool = typer.Option(
+        False, "--reverse", "-R", help="Reverse mode (server sends)"
+    ),
+    no_dns_cache: bool = typer.Option(
+        False, "--no-dns-cache", help="Resolve the host on every call"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """Run iperf3 bandwidth tests in client or server mode."""
+    # Each command imports only the wrapper it needs, which keeps startup
+    # cheap for the others (psutil in particular is slow to import)
+    from nettools.core.iperf3 import IPerf3Wrapper
+
     if verbose:
         logger.setLevel("DEBUG")
 
@@ -49,13 +72,21 @@ def iperf3_run(
             console.print(
                 f"[green]Running iperf3 client test to {client}:{port}[/green]"
             )
-            result = iperf3.run_client(host=client, port=port, duration=duration)
+            result = iperf3.run_client(
+                host=client,
+                port=port,
+                duration=duration,
+                parallel=parallel,
+                reverse=reverse,
+                use_dns_cache=not no_dns_cache,
+                include_raw=verbose,
+            )
         else:
             console.print("[red]Error: Must specify either --server or --client[/red]")
             raise typer.Exit(1)
 
         if json_output:
-            console.print(json.dumps(result, indent=2))
+            _write_json(result)
         else:
             _display_iperf3_result(result)
 
@@ -70,10 +101,15 @@ def ping_host(
     host: str = typer.Argument(..., help="Host to ping"),
     count: int = typer.Option(4, "--count", "-c", help="Number of pings"),
     timeout: int = typer.Option(5, "--timeout", "-t", help="Timeout in seconds"),
+    no_dns_cache: bool = typer.Option(
+        False, "--no-dns-cache", help="Resolve the host on every call"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """Ping a host and show connectivity results."""
+    from nettools.core.ping import PingWrapper
+
     if verbose:
         logger.setLevel("DEBUG")
 
@@ -81,10 +117,15 @@ def ping_host(
 
     try:
         console.print(f"[green]Pinging {host} with {count} packets[/green]")
-        result = ping.ping(host=host, count=count, timeout=timeout)
+        result = ping.ping(
+            host=host,
+            count=count,
+            timeout=timeout,
+            use_dns_cache=not no_dns_cache,
+        )
 
         if json_output:
-            console.print(json.dumps(result, indent=2))
+            _write_json(result)
         else:
             _display_ping_result(result)
 
@@ -94,6 +135,50 @@ def ping_host(
         raise typer.Exit(1)
 
 
+@app.command("ping-hosts")
+def ping_hosts(
+    hosts: str = typer.Argument(..., help="Comma-separated list of hosts"),
+    count: int = typer.Option(4, "--count", "-c", help="Number of pings per host"),
+    timeout: int = typer.Option(5, "--timeout", "-t", help="Timeout in seconds"),
+    concurrency: int = typer.Option(
+        50, "--concurrency", help="Maximum number of hosts pinged at once"
+    ),
+    no_dns_cache: bool = typer.Option(
+        False, "--no-dns-cache", help="Resolve the host on every call"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+) -> None:
+    """Ping several hosts concurrently and show connectivity results."""
+    from nettools.core.ping import PingWrapper
+
+    if verbose:
+        logger.setLevel("DEBUG")
+
+    host_list = [h.strip() for h in hosts.split(",") if h.strip()]
+    ping = PingWrapper()
+
+    try:
+        console.print(f"[green]Pinging {len(host_list)} hosts[/green]")
+        result = ping.ping_many(
+            hosts=host_list,
+            count=count,
+            timeout=timeout,
+            concurrency=concurrency,
+            use_dns_cache=not no_dns_cache,
+        )
+
+        if json_output:
+            _write_json(result)
+        else:
+            _display_ping_many_result(result)
+
+    except Exception as e:
+        logger.error(f"Ping error: {e}")
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command("check-ports")
 def check_ports(
     host: str = typer.Option("localhost", "--host", "-h", help="Host to check"),
@@ -103,6 +188,10 @@ def check_ports(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """Check if ports are open on a host."""
+    import asyncio
+
+    from nettools.core.ports import PortChecker
+
     if verbose:
         logger.setLevel("DEBUG")
 
@@ -111,10 +200,12 @@ def check_ports(
 
     try:
         console.print(f"[green]Checking ports {ports} on {host}[/green]")
-        result = checker.check_ports(host=host, ports=port_list, timeout=timeout)
+        result = asyncio.run(
+            checker.check_ports_async(host=host, ports=port_list, timeout=timeout)
+        )
 
         if json_output:
-            console.print(json.dumps(result, indent=2))
+            _write_json(result)
         else:
             _display_port_result(result)
 
@@ -130,6 +221,8 @@ def sysinfo(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """Display system information."""
+    from nettools.core.sysinfo import SystemInfo
+
     if verbose:
         logger.setLevel("DEBUG")
 
@@ -139,7 +232,7 @@ def sysinfo(
         result = sysinfo_obj.get_all_info()
 
         if json_output:
-            console.print(json.dumps(result, indent=2))
+            _write_json(result)
         else:
             _display_sysinfo_result(result)
 
@@ -149,15 +242,44 @@ def sysinfo(
         raise typer.Exit(1)
 
 
+def _write_json(result: dict) -> None:
+    """Write a command result to stdout as indented JSON.
+
+    Output goes straight to stdout rather than through the rich console, so
+    large results are not scanned for markup on their way out.
+    """
+    if _HAS_ORJSON and hasattr(sys.stdout, "buffer"):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        sys.stdout.buffer.flush()
+        return
+
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _kv_table(title: str) -> "Table":
+    """Create a two-column Metric/Value table."""
+    # rich.table is only needed for human-readable output, so --json runs
+    # never import it
+    from rich.table import Table
+
+    table = Table(title=title)
+    for name, style in _METRIC_VALUE_COLUMNS:
+        table.add_column(name, style=style)
+    return table
+
+
 def _display_iperf3_result(result: dict) -> None:
     """Display iperf3 results in a formatted table."""
     if result.get("mode") == "server":
         console.print("[yellow]Server running... Press Ctrl+C to stop[/yellow]")
         return
 
-    table = Table(title="iPerf3 Results")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
+    table = _kv_table("iPerf3 Results")
 
     if "bandwidth" in result:
         table.add_row("Bandwidth", f"{result['bandwidth']:.2f} Mbits/sec")
@@ -171,9 +293,7 @@ def _display_iperf3_result(result: dict) -> None:
 
 def _display_ping_result(result: dict) -> None:
     """Display ping results in a formatted table."""
-    table = Table(title=f"Ping Results for {result.get('host', 'Unknown')}")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
+    table = _kv_table(f"Ping Results for {result.get('host', 'Unknown')}")
 
     table.add_row("Packets Sent", str(result.get("packets_sent", 0)))
     table.add_row("Packets Received", str(result.get("packets_received", 0)))
@@ -189,8 +309,32 @@ def _display_ping_result(result: dict) -> None:
     console.print(table)
 
 
+def _display_ping_many_result(results: dict) -> None:
+    """Display multi-host ping results in a formatted table."""
+    from rich.table import Table
+
+    table = Table(title="Ping Results")
+    table.add_column("Host", style="cyan")
+    table.add_column("Received", style="green")
+    table.add_column("Packet Loss", style="yellow")
+    table.add_column("Average Time", style="green")
+
+    for host, result in results.items():
+        avg_time = result.get("avg_time")
+        table.add_row(
+            host,
+            f"{result.get('packets_received', 0)}/{result.get('packets_sent', 0)}",
+            f"{result.get('packet_loss', 0):.1f}%",
+            f"{avg_time:.2f} ms" if avg_time else "N/A",
+        )
+
+    console.print(table)
+
+
 def _display_port_result(result: dict) -> None:
     """Display port check results in a formatted table."""
+    from rich.table import Table
+
     table = Table(title=f"Port Check Results for {result.get('host', 'Unknown')}")
     table.add_column("Port", style="cyan")
     table.add_column("Status", style="green")
@@ -209,9 +353,7 @@ def _display_port_result(result: dict) -> None:
 def _display_sysinfo_result(result: dict) -> None:
     """Display system information in formatted tables."""
     # System overview
-    system_table = Table(title="System Information")
-    system_table.add_column("Metric", style="cyan")
-    system_table.add_column("Value", style="green")
+    system_table = _kv_table("System Information")
 
     system_table.add_row("Platform", result.get("platform", "Unknown"))
     system_table.add_row("Architecture", result.get("architecture", "Unknown"))
@@ -223,9 +365,7 @@ def _display_sysinfo_result(result: dict) -> None:
     # CPU information
     cpu_info = result.get("cpu", {})
     if cpu_info:
-        cpu_table = Table(title="CPU Information")
-        cpu_table.add_column("Metric", style="cyan")
-        cpu_table.add_column("Value", style="green")
+        cpu_table = _kv_table("CPU Information")
 
         cpu_table.add_row("CPU Count", str(cpu_info.get("count", 0)))
         cpu_table.add_row("CPU Usage", f"{cpu_info.get('usage', 0):.1f}%")
@@ -236,9 +376,7 @@ def _display_sysinfo_result(result: dict) -> None:
     # Memory information
     memory_info = result.get("memory", {})
     if memory_info:
-        memory_table = Table(title="Memory Information")
-        memory_table.add_column("Metric", style="cyan")
-        memory_table.add_column("Value", style="green")
+        memory_table = _kv_table("Memory Information")
 
         memory_table.add_row(
             "Total", f"{memory_info.get('total', 0) / (1024**3):.2f} GB"
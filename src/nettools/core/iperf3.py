@@ -1,57 +1,312 @@
 """iPerf3 wrapper for bandwidth testing."""
 
-import json
+import ctypes
+import ctypes.util
+import functools
+import io
+import logging
+import re
+import shutil
 import subprocess
+import threading
+from collections.abc import Iterable
 
+try:
+    import orjson as _json
+
+    _HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    import json as _json  # type: ignore[no-redef]
+
+    _HAVE_ORJSON = False
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from nettools.utils.dns_cache import resolve_host
 from nettools.utils.logger import get_logger
 
+# "[  5]   0.00-10.00  sec  1.10 GBytes   943 Mbits/sec    0   sender"
+_SENDER_BANDWIDTH_RE = re.compile(r"(\S+)\s+Mbits/sec[^\n]*sender")
+
+# Seconds a client run may take beyond its test duration before it is killed
+_CLIENT_TIMEOUT_GRACE = 30
+
+# void (*)(struct iperf_test *, char *json): receives libiperf's JSON report
+_JSON_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_char_p)
+
+
+@functools.cache
+def _iperf3_available() -> bool:
+    """Check whether iperf3 is installed, once per process.
+
+    Returns:
+        True if iperf3 is on PATH.
+    """
+    # A PATH lookup instead of running "iperf3 --version": no fork/exec, and
+    # a binary that is there but broken still fails clearly on first use
+    return shutil.which("iperf3") is not None
+
+
+@functools.cache
+def _load_libiperf() -> ctypes.CDLL | None:
+    """Load the iperf3 shared library, once per process.
+
+    Returns:
+        The library with the client API prototypes set, or None if it is not
+        installed.
+    """
+    for name in (ctypes.util.find_library("iperf"), "libiperf.so.0"):
+        if not name:
+            continue
+        try:
+            lib = ctypes.CDLL(name, use_errno=True)
+        except OSError:
+            continue
+
+        try:
+            lib.iperf_new_test.restype = ctypes.c_void_p
+            lib.iperf_new_test.argtypes = []
+            lib.iperf_defaults.argtypes = [ctypes.c_void_p]
+            lib.iperf_set_test_role.argtypes = [ctypes.c_void_p, ctypes.c_char]
+            lib.iperf_set_test_server_hostname.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_char_p,
+            ]
+            for setter in (
+                lib.iperf_set_test_server_port,
+                lib.iperf_set_test_duration,
+                lib.iperf_set_test_num_streams,
+                lib.iperf_set_test_reverse,
+                lib.iperf_set_test_json_output,
+            ):
+                setter.argtypes = [ctypes.c_void_p, ctypes.c_int]
+            lib.iperf_set_test_json_callback.argtypes = [
+                ctypes.c_void_p,
+                _JSON_CALLBACK,
+            ]
+            lib.iperf_run_client.argtypes = [ctypes.c_void_p]
+            lib.iperf_strerror.restype = ctypes.c_char_p
+            lib.iperf_strerror.argtypes = [ctypes.c_int]
+            lib.iperf_free_test.argtypes = [ctypes.c_void_p]
+        except AttributeError:
+            # Too old to hand the JSON report to a callback; such releases
+            # can only print it to stdout
+            continue
+
+        return lib
+
+    return None
+
+
+def _load_report(output: bytes, include_raw: bool) -> dict:
+    """Parse an iperf3 --json report.
+
+    Without orjson but with ijson installed, and unless the full report is
+    wanted, only the sections the summary needs are built; the per-interval
+    data, which makes up most of a long test's report, is skipped over. The
+    output is already in memory either way, so with orjson a single pass of
+    its parser is cheaper than ijson's two.
+
+    Args:
+        output: Report as written by iperf3
+        include_raw: Whether the full report will be kept
+
+    Returns:
+        The report, or the parts of it the summary reads.
+
+    Raises:
+        ValueError: If the output is not valid JSON.
+    """
+    if _HAVE_ORJSON or ijson is None or include_raw:
+        report: dict = _json.loads(output)
+        return report
+
+    try:
+        connecting_to: dict = next(
+            ijson.items(io.BytesIO(output), "start.connecting_to", use_float=True),
+            {},
+        )
+        end: dict = next(ijson.items(io.BytesIO(output), "end", use_float=True), {})
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid iperf3 report: {e}") from e
+
+    return {"start": {"connecting_to": connecting_to}, "end": end}
+
+
+def _summarize_report_fast(raw_result: dict) -> dict:
+    """Summarize a complete TCP client report.
+
+    The layout of a finished TCP test's report is fixed, so every field is
+    indexed directly.
+
+    Args:
+        raw_result: Parsed iperf3 report
+
+    Returns:
+        Summary in the layout of _parse_client_result.
+
+    Raises:
+        KeyError: If a section or field is missing.
+        TypeError: If a section has an unexpected type.
+    """
+    connecting_to = raw_result["start"]["connecting_to"]
+    end = raw_result["end"]
+    sum_sent = end["sum_sent"]
+    sum_received = end["sum_received"]
+    cpu_utilization = end["cpu_utilization_percent"]
+
+    primary_data = sum_received or sum_sent
+    bits_per_second = primary_data["bits_per_second"]
+
+    result = {
+        "mode": "client",
+        "host": connecting_to["host"],
+        "port": connecting_to["port"],
+        "duration": primary_data["seconds"],
+        "bytes_transferred": primary_data["bytes"],
+        "bits_per_second": bits_per_second,
+        "bandwidth": bits_per_second / 1_000_000,
+        "retransmits": sum_sent["retransmits"],
+        "cpu_utilization": {
+            "local": cpu_utilization["host_total"],
+            "remote": cpu_utilization["remote_total"],
+        },
+    }
+
+    streams = end["streams"]
+    if streams:
+        side = "receiver" if sum_received else "sender"
+        result["stream_bandwidths"] = [
+            stream[side]["bits_per_second"] / 1_000_000 for stream in streams
+        ]
+
+    return result
+
+
+def _summarize_report(raw_result: dict) -> dict:
+    """Summarize a client report that may be missing sections.
+
+    Args:
+        raw_result: Parsed iperf3 report
+
+    Returns:
+        Summary in the layout of _parse_client_result, with defaults for
+        whatever the report lacks.
+
+    Raises:
+        TypeError: If a section has an unexpected type.
+    """
+    connecting_to = (raw_result.get("start") or {}).get("connecting_to") or {}
+    end = raw_result.get("end") or {}
+    sum_sent = end.get("sum_sent") or {}
+    sum_received = end.get("sum_received") or {}
+    cpu_utilization = end.get("cpu_utilization_percent") or {}
+
+    # Use received data if available (for normal mode)
+    # Use sent data if in reverse mode or if received is not available
+    primary_data = sum_received if sum_received else sum_sent
+    bits_per_second = primary_data.get("bits_per_second", 0)
+
+    result = {
+        "mode": "client",
+        "host": connecting_to.get("host"),
+        "port": connecting_to.get("port"),
+        "duration": primary_data.get("seconds", 0),
+        "bytes_transferred": primary_data.get("bytes", 0),
+        "bits_per_second": bits_per_second,
+        "bandwidth": bits_per_second / 1_000_000,  # Convert to Mbits/sec
+        "retransmits": sum_sent.get("retransmits", 0),
+        "cpu_utilization": {
+            "local": cpu_utilization.get("host_total", 0),
+            "remote": cpu_utilization.get("remote_total", 0),
+        },
+    }
+
+    # Per-stream bandwidth in Mbits/sec, from the same side as the totals;
+    # iperf3 caps parallel streams at 128, so a plain comprehension is all
+    # this needs
+    streams = end.get("streams") or []
+    if streams:
+        side = "receiver" if sum_received else "sender"
+        result["stream_bandwidths"] = [
+            (stream.get(side) or {}).get("bits_per_second", 0) / 1_000_000
+            for stream in streams
+        ]
+
+    return result
+
 
 class IPerf3Wrapper:
     """Wrapper class for iperf3 operations."""
 
-    def __init__(self) -> None:
-        """Initialize the iperf3 wrapper."""
+    def __init__(self, use_libiperf: bool = False) -> None:
+        """Initialize the iperf3 wrapper.
+
+        Args:
+            use_libiperf: Run client tests in-process through libiperf when
+                the shared library is installed, instead of spawning iperf3
+        """
         self.logger = get_logger(self.__class__.__name__)
-        self._check_iperf3_availability()
+        self._libiperf = _load_libiperf() if use_libiperf else None
+        if use_libiperf and self._libiperf is None:
+            self.logger.debug("libiperf not found, using the iperf3 binary")
+        if self._libiperf is None:
+            self._check_iperf3_availability()
 
     def _check_iperf3_availability(self) -> None:
         """Check if iperf3 is available on the system."""
-        try:
-            result = subprocess.run(
-                ["iperf3", "--version"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode != 0:
-                raise FileNotFoundError("iperf3 not found or not executable")
-            self.logger.debug("iperf3 found and available")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        if not _iperf3_available():
             raise RuntimeError(
                 "iperf3 is not installed or not available in PATH. "
                 "Please install iperf3 to use this functionality."
             )
+        self.logger.debug("iperf3 found and available")
 
-    def run_server(self, port: int = 5201, bind_address: str | None = None) -> dict:
+    def run_server(
+        self,
+        port: int = 5201,
+        bind_address: str | None = None,
+        log_file: str | None = None,
+    ) -> dict:
         """Run iperf3 in server mode.
 
         Args:
             port: Port to listen on (default: 5201)
             bind_address: Address to bind to (default: all interfaces)
+            log_file: File to write the server output to (default: discarded)
 
         Returns:
             Dictionary with server information.
         """
+        if self._libiperf is not None:
+            # Not checked up front, since client runs do not need the binary
+            self._check_iperf3_availability()
+
         cmd = ["iperf3", "--server", "--port", str(port)]
 
         if bind_address:
             cmd.extend(["--bind", bind_address])
+        if log_file:
+            cmd.extend(["--logfile", log_file])
 
         self.logger.info(f"Starting iperf3 server on port {port}")
-        self.logger.debug(f"Command: {' '.join(cmd)}")
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Command: %s", " ".join(cmd))
 
         try:
             # For server mode, we need to handle this differently
-            # as it runs indefinitely until stopped
+            # as it runs indefinitely until stopped. Nobody reads its output,
+            # so it must not go to a pipe: once the pipe buffer fills the
+            # server blocks on write and stalls mid-test.
             process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
 
             return {
@@ -60,6 +315,7 @@ class IPerf3Wrapper:
                 "bind_address": bind_address,
                 "status": "running",
                 "pid": process.pid,
+                "log_file": log_file,
             }
 
         except subprocess.SubprocessError as e:
@@ -73,6 +329,9 @@ class IPerf3Wrapper:
         duration: int = 10,
         parallel: int = 1,
         reverse: bool = False,
+        use_dns_cache: bool = True,
+        include_raw: bool = False,
+        stream: bool = False,
     ) -> dict:
         """Run iperf3 in client mode.
 
@@ -82,49 +341,93 @@ class IPerf3Wrapper:
             duration: Test duration in seconds (default: 10)
             parallel: Number of parallel streams (default: 1)
             reverse: Run in reverse mode (server sends) (default: False)
+            use_dns_cache: Resolve the host through the shared DNS cache
+            include_raw: Include the full iperf3 JSON report in the result
+            stream: Read the report as it is produced with --json-stream
+                (iperf3 3.17 or later), one event per line, instead of as a
+                single document at exit
 
         Returns:
             Dictionary with test results.
         """
+        server = resolve_host(host) if use_dns_cache else host
+
+        if self._libiperf is not None:
+            if not stream:
+                self.logger.info(f"Running iperf3 client test to {host}:{port}")
+                try:
+                    raw_result = self._run_client_libiperf(
+                        self._libiperf, server, port, duration, parallel, reverse
+                    )
+                except subprocess.TimeoutExpired:
+                    self.logger.error("iperf3 client test timed out")
+                    raise RuntimeError("iperf3 client test timed out")
+                return self._parse_client_result(raw_result, include_raw)
+
+            # Not checked up front, since libiperf runs do not need the binary
+            self._check_iperf3_availability()
+
         cmd = [
             "iperf3",
             "--client",
-            host,
+            server,
             "--port",
             str(port),
             "--time",
             str(duration),
             "--parallel",
             str(parallel),
-            "--json",
+            "--json-stream" if stream else "--json",
         ]
 
         if reverse:
             cmd.append("--reverse")
 
         self.logger.info(f"Running iperf3 client test to {host}:{port}")
-        self.logger.debug(f"Command: {' '.join(cmd)}")
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Command: %s", " ".join(cmd))
 
         try:
-            result = subprocess.run(
+            # Read the report as raw bytes straight from the pipe; the JSON
+            # parser decodes it itself, so no intermediate str copy is made
+            with subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=duration + 30,  # Add buffer time
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Unknown iperf3 error"
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=-1,
+            ) as process:
+                timeout = duration + _CLIENT_TIMEOUT_GRACE
+                if stream:
+                    streamed, stderr = self._communicate_stream(
+                        process, include_raw, timeout
+                    )
+                else:
+                    # communicate drains stdout and stderr together, so a
+                    # chatty stderr cannot fill its pipe and stall iperf3
+                    try:
+                        output, stderr = process.communicate(timeout=timeout)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.communicate()
+                        raise
+
+            if process.returncode != 0:
+                error_msg = (
+                    stderr.decode(errors="replace").strip() or "Unknown iperf3 error"
+                )
                 raise RuntimeError(f"iperf3 client failed: {error_msg}")
 
+            if stream:
+                return self._parse_client_result(streamed, include_raw)
+
             # Parse JSON output
             try:
-                raw_result = json.loads(result.stdout)
-                return self._parse_client_result(raw_result)
-            except json.JSONDecodeError as e:
+                return self._parse_client_result(output, include_raw)
+            except ValueError as e:
                 self.logger.error(f"Failed to parse iperf3 JSON output: {e}")
                 # Fallback to text parsing
-                return self._parse_text_output(result.stdout)
+                return self._parse_text_output(output.decode(errors="replace"))
 
         except subprocess.TimeoutExpired:
             self.logger.error("iperf3 client test timed out")
@@ -133,55 +436,229 @@ class IPerf3Wrapper:
             self.logger.error(f"Failed to run iperf3 client: {e}")
             raise RuntimeError(f"Failed to run iperf3 client: {e}")
 
-    def _parse_client_result(self, raw_result: dict) -> dict:
+    def _run_client_libiperf(
+        self,
+        lib: ctypes.CDLL,
+        host: str,
+        port: int,
+        duration: int,
+        parallel: int,
+        reverse: bool,
+    ) -> dict:
+        """Run a client test in-process through libiperf.
+
+        The test runs on a daemon thread, which also frees it, so a stalled
+        run can be given up on after the same deadline as the binary.
+
+        Args:
+            lib: Loaded libiperf
+            host: Server hostname or IP address
+            port: Server port
+            duration: Test duration in seconds
+            parallel: Number of parallel streams
+            reverse: Run in reverse mode (server sends)
+
+        Returns:
+            The test's JSON report.
+
+        Raises:
+            RuntimeError: If the test cannot be set up or fails.
+            subprocess.TimeoutExpired: If the test did not finish in time.
+        """
+        test = lib.iperf_new_test()
+        if not test:
+            raise RuntimeError("iperf3 client failed: could not create test")
+
+        reports: list[bytes] = []
+        outcome: list[tuple[int, int]] = []
+
+        def run() -> None:
+            # libiperf hands the report to the callback instead of printing
+            # it to stdout; the callback lives as long as this frame
+            on_json = _JSON_CALLBACK(lambda _test, output: reports.append(output))
+            try:
+                lib.iperf_defaults(test)
+                lib.iperf_set_test_role(test, b"c")
+                lib.iperf_set_test_server_hostname(test, host.encode())
+                lib.iperf_set_test_server_port(test, port)
+                lib.iperf_set_test_duration(test, duration)
+                lib.iperf_set_test_num_streams(test, parallel)
+                lib.iperf_set_test_reverse(test, int(reverse))
+                lib.iperf_set_test_json_output(test, 1)
+                lib.iperf_set_test_json_callback(test, on_json)
+
+                status = lib.iperf_run_client(test)
+                i_errno = ctypes.c_int.in_dll(lib, "i_errno").value if status < 0 else 0
+                outcome.append((status, i_errno))
+            finally:
+                lib.iperf_free_test(test)
+
+        timeout = duration + _CLIENT_TIMEOUT_GRACE
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise subprocess.TimeoutExpired("libiperf", timeout)
+
+        if not outcome:
+            raise RuntimeError("iperf3 client failed: could not run test")
+
+        status, i_errno = outcome[0]
+        if status < 0:
+            error_msg = lib.iperf_strerror(i_errno).decode(errors="replace")
+            raise RuntimeError(f"iperf3 client failed: {error_msg}")
+
+        if not reports or not reports[-1]:
+            raise RuntimeError("iperf3 client failed: no report produced")
+
+        report: dict = _json.loads(reports[-1])
+        return report
+
+    def _communicate_stream(
+        self, process: subprocess.Popen, include_raw: bool, timeout: float
+    ) -> tuple[dict, bytes]:
+        """Read --json-stream events from a running client.
+
+        stderr is drained on a separate thread while events are read, so
+        neither pipe can fill up and stall iperf3, and the process is killed
+        if it is still running when the timeout expires.
+
+        Args:
+            process: iperf3 client started with piped stdout and stderr
+            include_raw: Keep the interval events in the report
+            timeout: Seconds the whole run may take
+
+        Returns:
+            (report, stderr output) tuple.
+
+        Raises:
+            subprocess.TimeoutExpired: If the run did not finish in time.
+            RuntimeError: If iperf3 reports an error event.
+        """
+        assert process.stdout is not None and process.stderr is not None
+        stderr_pipe = process.stderr
+        stderr_chunks: list[bytes] = []
+        reader = threading.Thread(
+            target=lambda: stderr_chunks.append(stderr_pipe.read()), daemon=True
+        )
+        reader.start()
+
+        # Killing the process closes its stdout, which ends the event loop
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            report = self._read_json_stream(process.stdout, include_raw)
+            process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+            reader.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(process.args, timeout)
+
+        return report, b"".join(stderr_chunks)
+
+    def _read_json_stream(self, lines: Iterable[bytes], include_raw: bool) -> dict:
+        """Assemble an iperf3 report from --json-stream output.
+
+        Each line is parsed as it arrives. Interval events are dropped unless
+        the raw report is wanted, so memory use does not grow with the test
+        duration.
+
+        Args:
+            lines: Lines of iperf3 --json-stream output
+            include_raw: Keep the interval events in the report
+
+        Returns:
+            Report in the layout of iperf3 --json output.
+
+        Raises:
+            RuntimeError: If iperf3 reports an error event.
+        """
+        report: dict = {"start": {}, "intervals": [], "end": {}}
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = _json.loads(line)
+            except _json.JSONDecodeError as e:
+                self.logger.debug("Skipping unparsable iperf3 event: %s", e)
+                continue
+
+            kind = event.get("event")
+            if kind == "interval":
+                if include_raw:
+                    report["intervals"].append(event.get("data"))
+            elif kind in ("start", "end"):
+                report[kind] = event.get("data") or {}
+            elif kind == "error":
+                raise RuntimeError(f"iperf3 client failed: {event.get('data')}")
+
+        return report
+
+    def _decode_stdout(self, stdout: bytes, include_raw: bool = False) -> dict:
+        """Decode the report iperf3 wrote to stdout.
+
+        Args:
+            stdout: Output of iperf3 --json
+            include_raw: Whether the full report will be kept
+
+        Returns:
+            The report, or the parts of it the summary reads.
+
+        Raises:
+            ValueError: If the output is not valid JSON.
+        """
+        return _load_report(stdout, include_raw)
+
+    def _parse_client_result(
+        self, raw_result: dict | bytes, include_raw: bool = False
+    ) -> dict:
         """Parse iperf3 JSON output into a standardized format.
 
         Args:
-            raw_result: Raw JSON result from iperf3
+            raw_result: Raw JSON result from iperf3, parsed or as output
+            include_raw: Keep the full report (including per-interval data)
+                under "raw_result"
 
         Returns:
             Parsed result dictionary.
+
+        Raises:
+            ValueError: If raw_result is output that is not valid JSON.
         """
-        try:
-            end = raw_result.get("end", {})
-            sum_sent = end.get("sum_sent", {})
-            sum_received = end.get("sum_received", {})
+        if isinstance(raw_result, bytes):
+            raw_result = self._decode_stdout(raw_result, include_raw)
 
-            # Use received data if available (for normal mode)
-            # Use sent data if in reverse mode or if received is not available
-            primary_data = sum_received if sum_received else sum_sent
+        try:
+            result = _summarize_report_fast(raw_result)
+        except (KeyError, TypeError):
+            # Partial or unusual reports (UDP tests, aborted runs) take the
+            # defensive walk instead
+            try:
+                result = _summarize_report(raw_result)
+            except (KeyError, TypeError) as e:
+                self.logger.error(f"Error parsing iperf3 result: {e}")
+                return {
+                    "mode": "client",
+                    "error": f"Failed to parse result: {e}",
+                    "raw_result": raw_result,
+                }
+
+        if include_raw:
+            result["raw_result"] = raw_result
 
-            return {
-                "mode": "client",
-                "host": raw_result.get("start", {})
-                .get("connecting_to", {})
-                .get("host"),
-                "port": raw_result.get("start", {})
-                .get("connecting_to", {})
-                .get("port"),
-                "duration": primary_data.get("seconds", 0),
-                "bytes_transferred": primary_data.get("bytes", 0),
-                "bits_per_second": primary_data.get("bits_per_second", 0),
-                "bandwidth": primary_data.get("bits_per_second", 0)
-                / 1_000_000,  # Convert to Mbits/sec
-                "retransmits": sum_sent.get("retransmits", 0),
-                "cpu_utilization": {
-                    "local": end.get("cpu_utilization_percent", {}).get(
-                        "host_total", 0
-                    ),
-                    "remote": end.get("cpu_utilization_percent", {}).get(
-                        "remote_total", 0
-                    ),
-                },
-                "raw_result": raw_result,
-            }
-        except (KeyError, TypeError) as e:
-            self.logger.error(f"Error parsing iperf3 result: {e}")
-            return {
-                "mode": "client",
-                "error": f"Failed to parse result: {e}",
-                "raw_result": raw_result,
-            }
+        return result
 
     def _parse_text_output(self, output: str) -> dict:
         """Parse text output as fallback when JSON parsing fails.
@@ -193,23 +670,17 @@ class IPerf3Wrapper:
             Basic result dictionary.
         """
         # This is a simple fallback parser for text output
-        lines = output.split("\n")
         result = {
             "mode": "client",
             "error": "JSON parsing failed, using text parsing",
             "raw_output": output,
         }
 
-        # Try to extract basic bandwidth information
-        for line in lines:
-            if "Mbits/sec" in line and "sender" in line:
-                try:
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if "Mbits/sec" in part and i > 0:
-                            result["bandwidth"] = float(parts[i - 1])
-                            break
-                except (ValueError, IndexError):
-                    pass
+        # Try to extract basic bandwidth information from the sender summary
+        for match in _SENDER_BANDWIDTH_RE.finditer(output):
+            try:
+                result["bandwidth"] = float(match.group(1))
+            except ValueError:
+                pass
 
         return result
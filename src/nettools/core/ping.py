@@ -1,12 +1,66 @@
 """Ping wrapper for network connectivity testing."""
 
+import logging
+import os
 import re
-import statistics
+import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Any
 
+from nettools.utils import icmp
+from nettools.utils.dns_cache import resolve, resolve_host
 from nettools.utils.logger import get_logger
 from nettools.utils.platform_detect import is_windows
 
+# "Reply from 8.8.8.8: bytes=32 time=20ms TTL=56"
+_WIN_TIME_RE = re.compile(r"time[<=](\d+)ms")
+# "Packets: Sent = 4, Received = 4, Lost = 0 (0% loss)"
+_WIN_LOSS_RE = re.compile(r"Lost = \d+ \((\d+)% loss\)")
+# "64 bytes from 8.8.8.8: icmp_seq=1 ttl=56 time=19.6 ms"
+_UNIX_TIME_RE = re.compile(r"time=(\d+\.?\d*)")
+# "4 packets transmitted, 4 received, 0% packet loss"
+_UNIX_LOSS_RE = re.compile(r"(\d+)% packet loss")
+
+# Count, per-reply timeout and packet size flags of the system ping binary
+_WINDOWS_PING_FLAGS = ("-n", "-w", "-l")
+_UNIX_PING_FLAGS = ("-c", "-W", "-s")
+
+# The platform cannot change while we run, so detect it once
+_IS_WINDOWS = is_windows()
+
+
+def _load_icmplib() -> ModuleType | None:
+    """Import icmplib if it is installed.
+
+    Returns:
+        The icmplib module, or None when it is not available.
+    """
+    try:
+        import icmplib
+    except ImportError:
+        return None
+
+    module: ModuleType = icmplib
+    return module
+
+
+def _has_raw_icmp_access() -> bool:
+    """Check whether this process may open raw ICMP sockets.
+
+    Returns:
+        True if running as root or a raw ICMP socket can be opened.
+    """
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        return True
+
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP):
+            return True
+    except OSError:
+        return False
+
 
 class PingWrapper:
     """Wrapper class for ping operations."""
@@ -14,6 +68,10 @@ class PingWrapper:
     def __init__(self) -> None:
         """Initialize the ping wrapper."""
         self.logger = get_logger(self.__class__.__name__)
+        self._icmplib = _load_icmplib()
+        self._privileged = self._icmplib is not None and _has_raw_icmp_access()
+        self._use_icmplib = self._privileged
+        self._use_dgram_icmp = icmp.is_available()
 
     def ping(
         self,
@@ -21,6 +79,7 @@ class PingWrapper:
         count: int = 4,
         timeout: int = 5,
         packet_size: int | None = None,
+        use_dns_cache: bool = True,
     ) -> dict:
         """Ping a host and return connectivity results.
 
@@ -29,18 +88,41 @@ class PingWrapper:
             count: Number of ping packets to send
             timeout: Timeout in seconds for each ping
             packet_size: Size of ping packets in bytes (optional)
+            use_dns_cache: Resolve the host through the shared DNS cache
 
         Returns:
             Dictionary with ping results.
         """
-        cmd = self._build_ping_command(host, count, timeout, packet_size)
+        if self._use_dgram_icmp:
+            self.logger.info(f"Pinging {host} with {count} packets")
+            try:
+                kwargs: dict[str, Any] = {}
+                if packet_size:
+                    kwargs["payload_size"] = packet_size
+                # The ICMP socket is IPv4 only, so ask for an IPv4 address
+                icmp_address = resolve(host, socket.AF_INET) if use_dns_cache else host
+                times = icmp.echo(icmp_address, count=count, timeout=timeout, **kwargs)
+                return self._echo_to_result(host, count, times)
+            except (OSError, UnicodeError) as e:
+                # UnicodeError: a name that is not valid IDNA; the paths below
+                # report it as a failed lookup
+                self.logger.debug(f"Unprivileged ICMP ping of {host} failed: {e}")
+
+        address = resolve_host(host) if use_dns_cache else host
+
+        if self._use_icmplib:
+            return self._ping_icmplib(host, address, count, timeout, packet_size)
+
+        cmd = self._build_ping_command(address, count, timeout, packet_size)
 
         self.logger.info(f"Pinging {host} with {count} packets")
-        self.logger.debug(f"Command: {' '.join(cmd)}")
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Command: %s", " ".join(cmd))
 
         try:
             result = subprocess.run(
                 cmd,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=timeout * count + 10,  # Add buffer time
@@ -67,6 +149,147 @@ class PingWrapper:
                 "error": str(e),
             }
 
+    def ping_many(
+        self,
+        hosts: list[str],
+        count: int = 4,
+        timeout: int = 5,
+        concurrency: int = 50,
+        use_dns_cache: bool = True,
+    ) -> dict[str, dict]:
+        """Ping several hosts concurrently.
+
+        Args:
+            hosts: Hostnames or IP addresses to ping
+            count: Number of ping packets to send to each host
+            timeout: Timeout in seconds for each ping
+            concurrency: Maximum number of hosts pinged at once
+            use_dns_cache: Resolve hosts through the shared DNS cache
+
+        Returns:
+            Dictionary mapping each host to its ping results.
+        """
+        if not hosts:
+            return {}
+
+        self.logger.info(f"Pinging {len(hosts)} hosts with {count} packets each")
+
+        if self._use_icmplib:
+            try:
+                replies = self._icmplib.multiping(  # type: ignore[union-attr]
+                    hosts,
+                    count=count,
+                    timeout=timeout,
+                    concurrent_tasks=concurrency,
+                    privileged=self._privileged,
+                )
+                return {
+                    host: self._host_to_result(host, reply)
+                    for host, reply in zip(hosts, replies, strict=True)
+                }
+            except self._icmplib.ICMPLibError as e:  # type: ignore[union-attr]
+                # multiping fails as a whole if any host cannot be resolved, so
+                # retry per host to report errors individually
+                self.logger.debug(f"multiping failed, pinging hosts one by one: {e}")
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(hosts))) as executor:
+            results = executor.map(
+                lambda host: self.ping(
+                    host, count, timeout, use_dns_cache=use_dns_cache
+                ),
+                hosts,
+            )
+            return dict(zip(hosts, results, strict=True))
+
+    def _ping_icmplib(
+        self,
+        host: str,
+        address: str,
+        count: int,
+        timeout: int,
+        packet_size: int | None,
+    ) -> dict:
+        """Ping a host in-process using icmplib raw sockets.
+
+        Args:
+            host: Hostname or IP address to ping
+            address: Resolved address of the host
+            count: Number of ping packets to send
+            timeout: Timeout in seconds for each ping
+            packet_size: Size of ping packets in bytes (optional)
+
+        Returns:
+            Dictionary with ping results.
+        """
+        self.logger.info(f"Pinging {host} with {count} packets")
+
+        kwargs: dict[str, Any] = {}
+        if packet_size:
+            kwargs["payload_size"] = packet_size
+
+        try:
+            reply = self._icmplib.ping(  # type: ignore[union-attr]
+                address, count=count, timeout=timeout, privileged=True, **kwargs
+            )
+        except self._icmplib.ICMPLibError as e:  # type: ignore[union-attr]
+            self.logger.error(f"Failed to ping {host}: {e}")
+            return {
+                "host": host,
+                "packets_sent": count,
+                "packets_received": 0,
+                "packet_loss": 100.0,
+                "error": str(e),
+            }
+
+        return self._host_to_result(host, reply)
+
+    def _host_to_result(self, host: str, reply: Any) -> dict:
+        """Convert an icmplib Host object into the standard result format.
+
+        Args:
+            host: Target host as given by the caller
+            reply: icmplib Host object
+
+        Returns:
+            Parsed ping results.
+        """
+        times = list(reply.rtts)
+
+        return {
+            "host": host,
+            "packets_sent": reply.packets_sent,
+            "packets_received": reply.packets_received,
+            "packet_loss": reply.packet_loss * 100,  # icmplib reports a ratio
+            "times": times,
+            "min_time": reply.min_rtt if times else None,
+            "max_time": reply.max_rtt if times else None,
+            "avg_time": reply.avg_rtt if times else None,
+            "raw_output": None,
+        }
+
+    def _echo_to_result(self, host: str, count: int, times: list[float]) -> dict:
+        """Convert round-trip times from icmp.echo into the standard result format.
+
+        Args:
+            host: Target host as given by the caller
+            count: Number of echo requests sent
+            times: Round-trip times in milliseconds of the replies received
+
+        Returns:
+            Parsed ping results.
+        """
+        return {
+            "host": host,
+            "packets_sent": count,
+            "packets_received": len(times),
+            "packet_loss": (count - len(times)) / count * 100 if count else 100.0,
+            "times": times,
+            "min_time": min(times) if times else None,
+            "max_time": max(times) if times else None,
+            "avg_time": sum(times) / len(times) if times else None,
+            "raw_output": None,
+        }
+
     def _build_ping_command(
         self, host: str, count: int, timeout: int, packet_size: int | None
     ) -> list[str]:
@@ -81,23 +304,23 @@ class PingWrapper:
         Returns:
             List of command arguments.
         """
-        if is_windows():
-            cmd = [
-                "ping",
-                "-n",
-                str(count),
-                "-w",
-                str(timeout * 1000),
-            ]  # Windows uses milliseconds
-            if packet_size:
-                cmd.extend(["-l", str(packet_size)])
+        if _IS_WINDOWS:
+            count_flag, timeout_flag, size_flag = _WINDOWS_PING_FLAGS
+            timeout_arg = str(timeout * 1000)  # Windows uses milliseconds
         else:
-            cmd = ["ping", "-c", str(count), "-W", str(timeout)]
-            if packet_size:
-                cmd.extend(["-s", str(packet_size)])
-
-        cmd.append(host)
-        return cmd
+            count_flag, timeout_flag, size_flag = _UNIX_PING_FLAGS
+            timeout_arg = str(timeout)
+
+        size_args = (size_flag, str(packet_size)) if packet_size else ()
+        return [
+            "ping",
+            count_flag,
+            str(count),
+            timeout_flag,
+            timeout_arg,
+            *size_args,
+            host,
+        ]
 
     def _parse_ping_output(
         self, stdout: str, stderr: str, host: str, count: int
@@ -130,7 +353,7 @@ class PingWrapper:
             return result
 
         try:
-            if is_windows():
+            if _IS_WINDOWS:
                 result.update(self._parse_windows_ping(stdout))
             else:
                 result.update(self._parse_unix_ping(stdout))
@@ -149,25 +372,13 @@ class PingWrapper:
         Returns:
             Parsed results dictionary.
         """
-        lines = output.split("\n")
-        times = []
-        packets_received = 0
-
-        # Extract round-trip times
-        for line in lines:
-            # Look for lines like "Reply from 8.8.8.8: bytes=32 time=20ms TTL=56"
-            time_match = re.search(r"time[<=](\d+)ms", line)
-            if time_match:
-                times.append(float(time_match.group(1)))
-                packets_received += 1
-
-        # Extract summary statistics
-        for line in lines:
-            # Look for packet loss info: "Packets: Sent = 4, Received = 4, Lost = 0 (0% loss)"
-            loss_match = re.search(r"Lost = \d+ \((\d+)% loss\)", line)
-            if loss_match:
-                packet_loss = float(loss_match.group(1))
-                break
+        # Scan the whole buffer at once rather than splitting it into lines
+        times = [float(match.group(1)) for match in _WIN_TIME_RE.finditer(output)]
+        packets_received = len(times)
+
+        loss_match = _WIN_LOSS_RE.search(output)
+        if loss_match:
+            packet_loss = float(loss_match.group(1))
         else:
             packet_loss = (len(times) / 4) * 100 if times else 100.0
 
@@ -182,7 +393,7 @@ class PingWrapper:
                 {
                     "min_time": min(times),
                     "max_time": max(times),
-                    "avg_time": statistics.mean(times),
+                    "avg_time": sum(times) / len(times),
                 }
             )
 
@@ -197,25 +408,13 @@ class PingWrapper:
         Returns:
             Parsed results dictionary.
         """
-        lines = output.split("\n")
-        times = []
-        packets_received = 0
-
-        # Extract round-trip times
-        for line in lines:
-            # Look for lines like "64 bytes from 8.8.8.8: icmp_seq=1 ttl=56 time=19.6 ms"
-            time_match = re.search(r"time=(\d+\.?\d*)", line)
-            if time_match:
-                times.append(float(time_match.group(1)))
-                packets_received += 1
-
-        # Extract summary statistics
-        for line in lines:
-            # Look for packet loss info: "4 packets transmitted, 4 received, 0% packet loss"
-            loss_match = re.search(r"(\d+)% packet loss", line)
-            if loss_match:
-                packet_loss = float(loss_match.group(1))
-                break
+        # Scan the whole buffer at once rather than splitting it into lines
+        times = [float(match.group(1)) for match in _UNIX_TIME_RE.finditer(output)]
+        packets_received = len(times)
+
+        loss_match = _UNIX_LOSS_RE.search(output)
+        if loss_match:
+            packet_loss = float(loss_match.group(1))
         else:
             packet_loss = (
                 ((len(times) - packets_received) / len(times)) * 100 if times else 100.0
@@ -232,7 +431,7 @@ class PingWrapper:
                 {
                     "min_time": min(times),
                     "max_time": max(times),
-                    "avg_time": statistics.mean(times),
+                    "avg_time": sum(times) / len(times),
                 }
             )
 
@@ -248,17 +447,19 @@ class PingWrapper:
         Returns:
             Dictionary with traceroute results.
         """
-        if is_windows():
+        if _IS_WINDOWS:
             cmd = ["tracert", "-h", str(max_hops), host]
         else:
             cmd = ["traceroute", "-m", str(max_hops), host]
 
         self.logger.info(f"Running traceroute to {host}")
-        self.logger.debug(f"Command: {' '.join(cmd)}")
+        if __debug__ and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Command: %s", " ".join(cmd))
 
         try:
             result = subprocess.run(
                 cmd,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=max_hops * 5 + 30,  # Generous timeout
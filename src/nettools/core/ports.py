@@ -1,19 +1,131 @@
 """Port checking utilities for network connectivity testing."""
 
+import asyncio
+import errno
+import ipaddress
+import selectors
 import socket
-import threading
+import struct
+import sys
 import time
-
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import cast
+
+from nettools.utils import tcp_syn
+from nettools.utils.dns_cache import resolve
 from nettools.utils.logger import get_logger
 
+# struct linger {on, seconds}: closing with a zero linger time sends a RST and
+# frees the socket at once instead of leaving it in TIME_WAIT
+_LINGER_ABORT = struct.pack("HH" if sys.platform == "win32" else "ii", 1, 0)
+
+# connect_ex results meaning a non-blocking connect is under way
+_CONNECT_IN_PROGRESS = frozenset({errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN})
+
+# Per-port error for ports outside the TCP range, worded like connect_ex's
+_PORT_RANGE_ERROR = "port must be 0-65535."
+
+# Linux bounds a blocking connect() by SO_SNDTIMEO, failing it with EINPROGRESS
+# once the timeout expires; other platforms ignore the option for connects
+_KERNEL_CONNECT_TIMEOUT = sys.platform.startswith("linux")
+
+# Ports probed by scan_common_ports
+COMMON_PORTS: tuple[int, ...] = (
+    21,  # FTP
+    22,  # SSH
+    23,  # Telnet
+    25,  # SMTP
+    53,  # DNS
+    80,  # HTTP
+    110,  # POP3
+    143,  # IMAP
+    443,  # HTTPS
+    993,  # IMAPS
+    995,  # POP3S
+    3389,  # RDP
+    5432,  # PostgreSQL
+    3306,  # MySQL
+    1433,  # MSSQL
+    6379,  # Redis
+    27017,  # MongoDB
+    5672,  # RabbitMQ
+    9200,  # Elasticsearch
+    8080,  # HTTP Alt
+)
+
+# Default port of each service known to check_service
+SERVICE_PORTS = MappingProxyType(
+    {
+        "http": 80,
+        "https": 443,
+        "ssh": 22,
+        "ftp": 21,
+        "smtp": 25,
+        "dns": 53,
+        "pop3": 110,
+        "imap": 143,
+        "telnet": 23,
+        "rdp": 3389,
+        "mysql": 3306,
+        "postgresql": 5432,
+        "redis": 6379,
+        "mongodb": 27017,
+        "rabbitmq": 5672,
+        "elasticsearch": 9200,
+    }
+)
+
+
+logger = get_logger("PortChecker")
+
+
+def _configure_probe_socket(sock: socket.socket, timeout: float) -> None:
+    """Set socket options that keep aborted probes from lingering.
+
+    Args:
+        sock: Freshly created TCP socket
+        timeout: Connection timeout in seconds
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_ABORT)
+
+    # Linux: give up on unacknowledged data after the timeout rather than the
+    # kernel's much longer retransmission schedule
+    if hasattr(socket, "TCP_USER_TIMEOUT"):
+        sock.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, int(timeout * 1000)
+        )
+
+
+def _resolve_address(host: str) -> tuple[socket.AddressFamily, str]:
+    """Resolve a host to the address family and address to connect to.
+
+    IP literals are used as given, without going through the resolver; names
+    are resolved to IPv4 through the shared DNS cache.
+
+    Args:
+        host: Hostname or IP address
+
+    Returns:
+        (address family, address) tuple.
+
+    Raises:
+        socket.gaierror: If the host name cannot be resolved.
+    """
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return socket.AF_INET, resolve(host, socket.AF_INET)
+
+    family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+    return family, str(ip)
+
 
 class PortChecker:
     """Utility class for checking port connectivity."""
 
-    def __init__(self) -> None:
-        """Initialize the port checker."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def check_port(self, host: str, port: int, timeout: int = 5) -> dict:
         """Check if a single port is open on a host.
 
@@ -28,13 +140,28 @@ class PortChecker:
         start_time = time.time()
 
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(timeout)
-                result = sock.connect_ex((host, port))
+            family, address = _resolve_address(host)
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                _configure_probe_socket(sock, timeout)
+                if _KERNEL_CONNECT_TIMEOUT and timeout > 0:
+                    # Let the kernel time the connect out, instead of Python
+                    # polling a non-blocking socket around it
+                    usec = max(1, round(timeout * 1_000_000))
+                    sock.setsockopt(
+                        socket.SOL_SOCKET,
+                        socket.SO_SNDTIMEO,
+                        struct.pack("ll", *divmod(usec, 1_000_000)),
+                    )
+                    result = sock.connect_ex((address, port))
+                    if result in _CONNECT_IN_PROGRESS:
+                        raise TimeoutError
+                else:
+                    sock.settimeout(timeout)
+                    result = sock.connect_ex((address, port))
                 response_time = time.time() - start_time
 
                 if result == 0:
-                    self.logger.debug(f"Port {port} is open on {host}")
+                    logger.debug("Port %d is open on %s", port, host)
                     return {
                         "port": port,
                         "open": True,
@@ -42,7 +169,7 @@ class PortChecker:
                         "error": None,
                     }
                 else:
-                    self.logger.debug(f"Port {port} is closed on {host}")
+                    logger.debug("Port %d is closed on %s", port, host)
                     return {
                         "port": port,
                         "open": False,
@@ -52,7 +179,7 @@ class PortChecker:
 
         except TimeoutError:
             response_time = time.time() - start_time
-            self.logger.debug(f"Port {port} check timed out on {host}")
+            logger.debug("Port %d check timed out on %s", port, host)
             return {
                 "port": port,
                 "open": False,
@@ -61,7 +188,7 @@ class PortChecker:
             }
         except socket.gaierror as e:
             response_time = time.time() - start_time
-            self.logger.error(f"DNS resolution failed for {host}: {e}")
+            logger.error("DNS resolution failed for %s: %s", host, e)
             return {
                 "port": port,
                 "open": False,
@@ -70,7 +197,7 @@ class PortChecker:
             }
         except Exception as e:
             response_time = time.time() - start_time
-            self.logger.error(f"Error checking port {port} on {host}: {e}")
+            logger.error("Error checking port %d on %s: %s", port, host, e)
             return {
                 "port": port,
                 "open": False,
@@ -79,7 +206,12 @@ class PortChecker:
             }
 
     def check_ports(
-        self, host: str, ports: list[int], timeout: int = 5, max_threads: int = 50
+        self,
+        host: str,
+        ports: Sequence[int],
+        timeout: int = 5,
+        max_threads: int = 50,
+        method: str = "connect",
     ) -> dict:
         """Check multiple ports on a host concurrently.
 
@@ -87,43 +219,447 @@ class PortChecker:
             host: Hostname or IP address
             ports: List of port numbers to check
             timeout: Connection timeout in seconds for each port
-            max_threads: Maximum number of concurrent threads
+            max_threads: Maximum number of connections in flight, kept under
+                the process file descriptor limit
+            method: "connect" for full TCP connects, "thread" for full TCP
+                connects each made by check_port on a pool of up to
+                max_threads threads, or "syn" for a half-open SYN scan. SYN
+                scans need root on Linux and fall back to connects elsewhere.
 
         Returns:
             Dictionary with results for all ports.
+
+        Raises:
+            ValueError: If the scan method is unknown.
+        """
+        if method not in ("connect", "thread", "syn"):
+            raise ValueError(f"Unknown scan method: {method}")
+
+        logger.info("Checking %d ports on %s", len(ports), host)
+
+        start_time = time.time()
+
+        try:
+            family, address = _resolve_address(host)
+        except socket.gaierror as e:
+            return self._resolution_failed(host, ports, e, start_time)
+
+        if method == "syn":
+            if family != socket.AF_INET:
+                logger.debug("SYN scans are IPv4 only, using connect")
+            elif tcp_syn.is_available():
+                try:
+                    return self._check_ports_syn(
+                        host, address, ports, timeout, start_time
+                    )
+                except OSError as e:
+                    logger.debug("SYN scan of %s failed, using connect: %s", host, e)
+            else:
+                logger.debug("SYN scans need root on Linux, using connect")
+
+        if method == "thread":
+            # Blocking connects release the GIL, so the threads wait on the
+            # network in parallel; map keeps the results in port order
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_threads, len(ports)))
+            ) as executor:
+                checked = list(
+                    executor.map(
+                        lambda port: self.check_port(address, port, timeout), ports
+                    )
+                )
+            return self._summarize_results(
+                host, ports, checked, time.time() - start_time
+            )
+
+        results = self._check_ports_nb(
+            host, family, address, ports, timeout, max_threads
+        )
+
+        return self._summarize_results(host, ports, results, time.time() - start_time)
+
+    def _check_ports_nb(
+        self,
+        host: str,
+        family: socket.AddressFamily,
+        address: str,
+        ports: Sequence[int],
+        timeout: int,
+        max_connections: int,
+    ) -> list[dict]:
+        """Check multiple ports with non-blocking connects on one selector.
+
+        Args:
+            host: Hostname or IP address as given by the caller
+            family: Address family of the resolved address
+            address: Resolved address of the host
+            ports: List of port numbers to check
+            timeout: Connection timeout in seconds for each port
+            max_connections: Maximum number of connections in flight
+
+        Returns:
+            Per-port check results, in the order the ports were given.
+        """
+        # Each connect fills in its own slot, so results come out in the
+        # order the ports were given without sorting
+        results: list[dict | None] = [None] * len(ports)
+        pending = iter(enumerate(ports))
+        # Sockets still connecting, with their index, port and start time;
+        # connects start in order, so the oldest has the nearest deadline
+        inflight: dict[socket.socket, tuple[int, int, float]] = {}
+        started_order: deque[socket.socket] = deque()
+
+        def finish(sock: socket.socket, error: str | None) -> None:
+            index, port, started = inflight.pop(sock)
+            selector.unregister(sock)
+            sock.close()
+            results[index] = {
+                "port": port,
+                "open": error is None,
+                "response_time": time.time() - started,
+                "error": error,
+            }
+
+        def start_connects() -> None:
+            while len(inflight) < max_connections:
+                item = next(pending, None)
+                if item is None:
+                    return
+
+                index, port = item
+                started = time.time()
+                try:
+                    sock = socket.socket(family, socket.SOCK_STREAM)
+                except OSError as e:
+                    logger.error("Error checking port %d on %s: %s", port, host, e)
+                    results[index] = {
+                        "port": port,
+                        "open": False,
+                        "response_time": 0.0,
+                        "error": str(e),
+                    }
+                    continue
+
+                inflight[sock] = (index, port, started)
+                started_order.append(sock)
+                selector.register(sock, selectors.EVENT_WRITE, sock)
+
+                try:
+                    _configure_probe_socket(sock, timeout)
+                    sock.setblocking(False)
+                    code = sock.connect_ex((address, port))
+                except (OverflowError, OSError) as e:
+                    # An out-of-range port only fails its own entry
+                    logger.error("Error checking port %d on %s: %s", port, host, e)
+                    finish(sock, str(e))
+                    continue
+
+                if code == 0:
+                    finish(sock, None)
+                elif code not in _CONNECT_IN_PROGRESS:
+                    finish(sock, f"Connection failed (error code: {code})")
+
+        # Connect without blocking and wait on every socket at once, so a scan
+        # of unreachable ports takes about one timeout rather than one per port
+        with selectors.DefaultSelector() as selector:
+            try:
+                start_connects()
+
+                while inflight:
+                    while started_order[0] not in inflight:
+                        started_order.popleft()
+
+                    oldest = started_order[0]
+                    remaining = inflight[oldest][2] + timeout - time.time()
+                    if remaining <= 0:
+                        finish(oldest, "Connection timeout")
+                    else:
+                        for key, _ in selector.select(remaining):
+                            sock = key.data
+                            code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                            if code == 0:
+                                finish(sock, None)
+                            else:
+                                finish(sock, f"Connection failed (error code: {code})")
+
+                    start_connects()
+            finally:
+                for sock in inflight:
+                    sock.close()
+
+        return cast(list[dict], results)
+
+    def _check_ports_syn(
+        self,
+        host: str,
+        address: str,
+        ports: Sequence[int],
+        timeout: int,
+        start_time: float,
+    ) -> dict:
+        """Check multiple ports with a raw-socket SYN scan.
+
+        Args:
+            host: Hostname or IP address as given by the caller
+            address: Resolved IPv4 address of the host
+            ports: List of port numbers to check
+            timeout: Seconds to wait for replies
+            start_time: When the scan started
+
+        Returns:
+            Dictionary with results for all ports.
+
+        Raises:
+            OSError: If the raw socket cannot be used.
         """
-        self.logger.info(f"Checking {len(ports)} ports on {host}")
+        # Ports that cannot be put in a TCP header fail on their own, like
+        # the range check of connect_ex does for the other methods
+        replies = tcp_syn.scan(address, [p for p in ports if 0 <= p <= 65535], timeout)
 
         results = []
-        threads = []
-        semaphore = threading.Semaphore(max_threads)
+        for port in ports:
+            if not 0 <= port <= 65535:
+                logger.error(
+                    "Error checking port %d on %s: %s", port, host, _PORT_RANGE_ERROR
+                )
+                results.append(
+                    {
+                        "port": port,
+                        "open": False,
+                        "response_time": 0.0,
+                        "error": _PORT_RANGE_ERROR,
+                    }
+                )
+                continue
+
+            reply = replies.get(port)
+            if reply is None:
+                # No answer at all: filtered or unreachable
+                results.append(
+                    {
+                        "port": port,
+                        "open": False,
+                        "response_time": float(timeout),
+                        "error": "Connection timeout",
+                    }
+                )
+                continue
+
+            is_open, response_time = reply
+            results.append(
+                {
+                    "port": port,
+                    "open": is_open,
+                    "response_time": response_time,
+                    "error": (
+                        None
+                        if is_open
+                        else f"Connection failed (error code: {errno.ECONNREFUSED})"
+                    ),
+                }
+            )
+
+        return self._summarize_results(host, ports, results, time.time() - start_time)
+
+    async def acheck_port(self, host: str, port: int, timeout: int = 5) -> dict:
+        """Check if a single port is open on a host using asyncio.
 
-        def check_port_worker(port: int) -> None:
-            """Worker function for threaded port checking."""
-            with semaphore:
-                result = self.check_port(host, port, timeout)
-                results.append(result)
+        Args:
+            host: Hostname or IP address
+            port: Port number to check
+            timeout: Connection timeout in seconds
 
+        Returns:
+            Dictionary with port check result.
+        """
         start_time = time.time()
 
-        # Start threads for each port
-        for port in ports:
-            thread = threading.Thread(target=check_port_worker, args=(port,))
-            thread.start()
-            threads.append(thread)
+        try:
+            family, address = await asyncio.get_running_loop().run_in_executor(
+                None, _resolve_address, host
+            )
+        except socket.gaierror as e:
+            logger.error("DNS resolution failed for %s: %s", host, e)
+            return {
+                "port": port,
+                "open": False,
+                "response_time": time.time() - start_time,
+                "error": f"DNS resolution failed: {e}",
+            }
+
+        return await self._check_port_async(address, port, timeout, family=family)
+
+    async def check_ports_async(
+        self,
+        host: str,
+        ports: Sequence[int],
+        timeout: int = 5,
+        max_concurrency: int = 500,
+    ) -> dict:
+        """Check multiple ports on a host concurrently using asyncio.
+
+        All probes run on one event loop instead of a thread per port.
+
+        Args:
+            host: Hostname or IP address
+            ports: List of port numbers to check
+            timeout: Connection timeout in seconds for each port
+            max_concurrency: Maximum number of connections in flight, to stay
+                clear of the process file descriptor limit
+
+        Returns:
+            Dictionary with results for all ports.
+        """
+        logger.info("Checking %d ports on %s", len(ports), host)
 
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        start_time = time.time()
 
+        # Resolve the host once up front rather than once per connection; the
+        # lookup may block, so keep it off the event loop
+        try:
+            family, address = await asyncio.get_running_loop().run_in_executor(
+                None, _resolve_address, host
+            )
+        except socket.gaierror as e:
+            return self._resolution_failed(host, ports, e, start_time)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def check_port_limited(port: int) -> dict:
+            async with semaphore:
+                return await self._check_port_async(
+                    address, port, timeout, family=family
+                )
+
+        results = list(await asyncio.gather(*(check_port_limited(p) for p in ports)))
         total_time = time.time() - start_time
 
-        # Sort results by port number
-        results.sort(key=lambda x: x["port"])
+        return self._summarize_results(host, ports, results, total_time)
+
+    # Async counterpart of check_ports, named to match acheck_port
+    acheck_ports = check_ports_async
+
+    async def _check_port_async(
+        self,
+        host: str,
+        port: int,
+        timeout: int,
+        family: socket.AddressFamily = socket.AF_INET,
+    ) -> dict:
+        """Check if a single port is open without blocking the event loop.
+
+        Args:
+            host: Hostname or IP address
+            port: Port number to check
+            timeout: Connection timeout in seconds
+            family: Address family of the socket to connect with
+
+        Returns:
+            Dictionary with port check result.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        _configure_probe_socket(sock, timeout)
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout)
+        except asyncio.TimeoutError:
+            logger.debug("Port %d check timed out on %s", port, host)
+            return {
+                "port": port,
+                "open": False,
+                "response_time": time.time() - start_time,
+                "error": "Connection timeout",
+            }
+        except socket.gaierror as e:
+            logger.error("DNS resolution failed for %s: %s", host, e)
+            return {
+                "port": port,
+                "open": False,
+                "response_time": time.time() - start_time,
+                "error": f"DNS resolution failed: {e}",
+            }
+        except OSError as e:
+            logger.debug("Port %d is closed on %s", port, host)
+            return {
+                "port": port,
+                "open": False,
+                "response_time": time.time() - start_time,
+                "error": f"Connection failed (error code: {e.errno})",
+            }
+        except OverflowError as e:
+            # Port out of range; fail this port rather than the whole gather
+            logger.error("Error checking port %d on %s: %s", port, host, e)
+            return {
+                "port": port,
+                "open": False,
+                "response_time": time.time() - start_time,
+                "error": str(e),
+            }
+        finally:
+            sock.close()
+
+        response_time = time.time() - start_time
+        logger.debug("Port %d is open on %s", port, host)
+
+        return {
+            "port": port,
+            "open": True,
+            "response_time": response_time,
+            "error": None,
+        }
 
-        # Calculate summary statistics
-        open_ports = [r for r in results if r["open"]]
-        closed_ports = [r for r in results if not r["open"]]
+    def _resolution_failed(
+        self, host: str, ports: Sequence[int], error: socket.gaierror, start_time: float
+    ) -> dict:
+        """Build the check_ports result for a host that could not be resolved.
+
+        Args:
+            host: Hostname that failed to resolve
+            ports: List of port numbers that were to be checked
+            error: The resolver error
+            start_time: When the scan started
+
+        Returns:
+            Dictionary with a DNS error result for every port.
+        """
+        logger.error("DNS resolution failed for %s: %s", host, error)
+        message = f"DNS resolution failed: {error}"
+        results = [
+            {"port": p, "open": False, "response_time": 0.0, "error": message}
+            for p in ports
+        ]
+        return self._summarize_results(host, ports, results, time.time() - start_time)
+
+    def _summarize_results(
+        self, host: str, ports: Sequence[int], results: list[dict], total_time: float
+    ) -> dict:
+        """Build the check_ports result dictionary from per-port results.
+
+        Args:
+            host: Hostname or IP address that was checked
+            ports: List of port numbers that were checked
+            results: Per-port check results, in the order the ports were given
+            total_time: Wall time of the whole scan in seconds
+
+        Returns:
+            Dictionary with results for all ports.
+        """
+        # Calculate summary statistics in a single pass
+        open_ports = []
+        closed_ports = []
+        errors = []
+        for r in results:
+            if r["open"]:
+                open_ports.append(r["port"])
+            else:
+                closed_ports.append(r["port"])
+
+            error = r["error"]
+            if error and "timeout" not in error.lower():
+                errors.append(r)
 
         return {
             "host": host,
@@ -133,13 +669,9 @@ class PortChecker:
             "scan_time": total_time,
             "ports": results,
             "summary": {
-                "open": [r["port"] for r in open_ports],
-                "closed": [r["port"] for r in closed_ports],
-                "errors": [
-                    r
-                    for r in results
-                    if r["error"] and "timeout" not in r["error"].lower()
-                ],
+                "open": open_ports,
+                "closed": closed_ports,
+                "errors": errors,
             },
         }
 
@@ -153,31 +685,9 @@ class PortChecker:
         Returns:
             Dictionary with scan results.
         """
-        common_ports = [
-            21,  # FTP
-            22,  # SSH
-            23,  # Telnet
-            25,  # SMTP
-            53,  # DNS
-            80,  # HTTP
-            110,  # POP3
-            143,  # IMAP
-            443,  # HTTPS
-            993,  # IMAPS
-            995,  # POP3S
-            3389,  # RDP
-            5432,  # PostgreSQL
-            3306,  # MySQL
-            1433,  # MSSQL
-            6379,  # Redis
-            27017,  # MongoDB
-            5672,  # RabbitMQ
-            9200,  # Elasticsearch
-            8080,  # HTTP Alt
-        ]
 
-        self.logger.info(f"Scanning common ports on {host}")
-        return self.check_ports(host, common_ports, timeout)
+        logger.info("Scanning common ports on %s", host)
+        return self.check_ports(host, COMMON_PORTS, timeout)
 
     def check_service(self, host: str, service: str, timeout: int = 5) -> dict:
         """Check if a specific service is running by testing its default port.
@@ -190,34 +700,14 @@ class PortChecker:
         Returns:
             Dictionary with service check result.
         """
-        service_ports = {
-            "http": 80,
-            "https": 443,
-            "ssh": 22,
-            "ftp": 21,
-            "smtp": 25,
-            "dns": 53,
-            "pop3": 110,
-            "imap": 143,
-            "telnet": 23,
-            "rdp": 3389,
-            "mysql": 3306,
-            "postgresql": 5432,
-            "redis": 6379,
-            "mongodb": 27017,
-            "rabbitmq": 5672,
-            "elasticsearch": 9200,
-        }
-
-        service_lower = service.lower()
-        if service_lower not in service_ports:
+        port = SERVICE_PORTS.get(service.lower())
+        if port is None:
             return {
                 "service": service,
                 "host": host,
-                "error": f"Unknown service: {service}. Known services: {', '.join(service_ports.keys())}",
+                "error": f"Unknown service: {service}. Known services: {', '.join(SERVICE_PORTS)}",
             }
 
-        port = service_ports[service_lower]
         result = self.check_port(host, port, timeout)
 
         return {
@@ -1,20 +1,136 @@
 """System information utilities."""
 
+import copy
+import queue
+import threading
 import time
-from datetime import datetime, timedelta
-
-import psutil
+from collections.abc import Callable
+from typing import Any, ClassVar, NamedTuple, TypeVar
 
 from nettools.utils.logger import get_logger
-from nettools.utils.platform_detect import get_platform_info
+from nettools.utils.platform_detect import get_platform_info, is_linux
+
+# Shortest window CPU usage is measured over, in seconds
+MIN_CPU_SAMPLE_INTERVAL = 0.1
+# Seconds to wait for the usage of all disk partitions, and the most threads
+# reading it at once
+DISK_USAGE_TIMEOUT = 2.0
+DISK_USAGE_WORKERS = 8
+# Seconds network details, the partition list and platform details are
+# reused for
+NETWORK_CACHE_TTL = 1.0
+PARTITIONS_CACHE_TTL = 60.0
+PLATFORM_CACHE_TTL = 60.0
+# Seconds per-process CPU usage is measured over
+PROCESS_CPU_SAMPLE_INTERVAL = 0.2
+
+_PROCESS_ATTRS = ["pid", "name", "username", "cpu_percent", "memory_percent"]
+
+_PROC_MEMINFO = "/proc/meminfo"
+_PROC_UPTIME = "/proc/uptime"
+
+logger = get_logger("SystemInfo")
+
+_T = TypeVar("_T")
+
+
+class _Memory(NamedTuple):
+    """Virtual memory figures, laid out like psutil.virtual_memory()."""
+
+    total: int
+    available: int
+    used: int
+    free: int
+    percent: float
+
+
+class _Swap(NamedTuple):
+    """Swap figures, laid out like psutil.swap_memory()."""
+
+    total: int
+    used: int
+    free: int
+    percent: float
+
+
+class _ProcSnapshot(NamedTuple):
+    """Memory and uptime read from /proc in one pass."""
+
+    memory: _Memory
+    swap: _Swap
+    uptime: float
+
+
+def _read_proc_uptime() -> float:
+    """Read the seconds since boot from /proc/uptime (Linux only).
+
+    Returns:
+        Uptime in seconds.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file's contents are not as expected.
+        IndexError: If the file is empty.
+    """
+    # "90061.52 170000.00": uptime, then idle time summed over all CPUs
+    with open(_PROC_UPTIME, "rb") as f:
+        return float(f.read().split()[0])
+
+
+def _plural(count: int, unit: str) -> str:
+    """Format a count with its unit, pluralized, e.g. "2 hours"."""
+    return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
 
 
 class SystemInfo:
-    """Utility class for gathering system information."""
+    """Utility class for gathering system information.
+
+    psutil and datetime are imported by the methods that need them, so loading
+    this module (and the CLI) does not pay for them up front.
+    """
+
+    # (fetched at, value) of details that rarely change, shared by every
+    # instance so short-lived instances benefit as well
+    _cache: ClassVar[dict[str, tuple[float, Any]]] = {}
+
+    # Mountpoints whose disk usage is still being read, possibly by a thread
+    # stuck on a hung mount from an earlier call
+    _disk_probes: ClassVar[set[str]] = set()
+    _disk_probes_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self) -> None:
         """Initialize the system info utility."""
-        self.logger = get_logger(self.__class__.__name__)
+        import psutil
+
+        # cpu_percent(interval=None) reports usage since its previous call, so
+        # take the first snapshot now and let get_cpu_info avoid a long sleep
+        psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+
+        # (fetched at, value) of network details, which change more often
+        self._net_cache: tuple[float, dict] | None = None
+
+    @classmethod
+    def _cached(cls, key: str, ttl: float, fetch: Callable[[], _T]) -> _T:
+        """Return a value from the shared cache, fetching it when stale.
+
+        Args:
+            key: Cache entry name
+            ttl: Seconds a fetched value is reused for
+            fetch: Function producing a fresh value
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        now = time.monotonic()
+        entry = cls._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            cached: _T = entry[1]
+            return cached
+
+        value = fetch()
+        cls._cache[key] = (now, value)
+        return value
 
     def get_all_info(self) -> dict:
         """Get comprehensive system information.
@@ -22,21 +138,100 @@ class SystemInfo:
         Returns:
             Dictionary with all system information.
         """
-        self.logger.debug("Gathering system information")
+        from datetime import datetime
+
+        logger.debug("Gathering system information")
+
+        # On Linux, read memory and uptime straight from /proc in one pass
+        # instead of letting psutil open the same files once per figure
+        snapshot = self._read_proc_snapshot()
+        if snapshot is not None:
+            memory = self._build_memory_info(snapshot.memory, snapshot.swap)
+            uptime = self._format_uptime(snapshot.uptime)
+        else:
+            memory = self.get_memory_info()
+            uptime = self.get_uptime()
 
         return {
             **self.get_platform_info(),
             "cpu": self.get_cpu_info(),
-            "memory": self.get_memory_info(),
+            "memory": memory,
             "disk": self.get_disk_info(),
             "network": self.get_network_info(),
-            "uptime": self.get_uptime(),
+            "uptime": uptime,
             "timestamp": datetime.now().isoformat(),
         }
 
+    def _read_proc_snapshot(self) -> _ProcSnapshot | None:
+        """Read memory and uptime figures from /proc.
+
+        Figures are derived the way psutil 7 derives them on Linux.
+
+        Returns:
+            The figures, or None when not on Linux or /proc cannot be read.
+        """
+        if not is_linux():
+            return None
+
+        try:
+            with open(_PROC_MEMINFO, "rb") as f:
+                meminfo_lines = f.read().splitlines()
+            uptime = _read_proc_uptime()
+        except (OSError, ValueError, IndexError) as e:
+            logger.debug("Could not read /proc, using psutil: %s", e)
+            return None
+
+        # "MemTotal:       16314984 kB"
+        meminfo = {}
+        for line in meminfo_lines:
+            fields = line.split()
+            if len(fields) >= 2:
+                meminfo[fields[0].rstrip(b":")] = int(fields[1]) * 1024
+
+        try:
+            total = meminfo[b"MemTotal"]
+            free = meminfo[b"MemFree"]
+            swap_total = meminfo[b"SwapTotal"]
+            swap_free = meminfo[b"SwapFree"]
+        except KeyError as e:
+            logger.debug("Missing %s in /proc/meminfo, using psutil", e)
+            return None
+
+        available = meminfo.get(b"MemAvailable", free)
+        used = total - available
+        swap_used = swap_total - swap_free
+
+        return _ProcSnapshot(
+            memory=_Memory(
+                total=total,
+                available=available,
+                used=used,
+                free=free,
+                percent=round((total - available) / total * 100, 1) if total else 0.0,
+            ),
+            swap=_Swap(
+                total=swap_total,
+                used=swap_used,
+                free=swap_free,
+                percent=round(swap_used / swap_total * 100, 1) if swap_total else 0.0,
+            ),
+            uptime=uptime,
+        )
+
     def get_platform_info(self) -> dict:
         """Get platform and OS information.
 
+        Returns:
+            Dictionary with platform details.
+        """
+        # Copy so callers can modify the result without touching the cache
+        return dict(
+            self._cached("platform", PLATFORM_CACHE_TTL, self._read_platform_info)
+        )
+
+    def _read_platform_info(self) -> dict:
+        """Read platform and OS information.
+
         Returns:
             Dictionary with platform details.
         """
@@ -53,17 +248,29 @@ class SystemInfo:
             "processor": platform_info["processor"],
         }
 
-    def get_cpu_info(self) -> dict:
+    def get_cpu_info(self, interval: float = MIN_CPU_SAMPLE_INTERVAL) -> dict:
         """Get CPU information and usage statistics.
 
+        Args:
+            interval: Minimum number of seconds usage is measured over. Only the
+                part not yet elapsed since the previous sample is waited for.
+
         Returns:
             Dictionary with CPU details.
         """
+        import psutil
+
         try:
+            remaining = self._cpu_sampled_at + interval - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            usage = psutil.cpu_percent(interval=None)
+            self._cpu_sampled_at = time.monotonic()
+
             cpu_info = {
                 "count": psutil.cpu_count(logical=True),
                 "physical_count": psutil.cpu_count(logical=False),
-                "usage": psutil.cpu_percent(interval=1),
+                "usage": usage,
                 "frequency": None,
                 "load_avg": None,
             }
@@ -78,7 +285,7 @@ class SystemInfo:
                         "max": freq.max,
                     }
             except (AttributeError, NotImplementedError):
-                self.logger.debug("CPU frequency information not available")
+                logger.debug("CPU frequency information not available")
 
             # Get load average (Unix-like systems only)
             try:
@@ -90,12 +297,12 @@ class SystemInfo:
                         "15min": load_avg[2],
                     }
             except (AttributeError, NotImplementedError):
-                self.logger.debug("Load average information not available")
+                logger.debug("Load average information not available")
 
             return cpu_info
 
         except Exception as e:
-            self.logger.error(f"Error getting CPU info: {e}")
+            logger.error("Error getting CPU info: %s", e)
             return {"error": str(e)}
 
     def get_memory_info(self) -> dict:
@@ -104,34 +311,47 @@ class SystemInfo:
         Returns:
             Dictionary with memory details.
         """
+        import psutil
+
         try:
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
+            return self._build_memory_info(
+                psutil.virtual_memory(), psutil.swap_memory()
+            )
 
-            return {
-                "virtual": {
-                    "total": memory.total,
-                    "available": memory.available,
-                    "used": memory.used,
-                    "free": memory.free,
-                    "percent": memory.percent,
-                },
-                "swap": {
-                    "total": swap.total,
-                    "used": swap.used,
-                    "free": swap.free,
-                    "percent": swap.percent,
-                },
-                # Backward compatibility
+        except Exception as e:
+            logger.error("Error getting memory info: %s", e)
+            return {"error": str(e)}
+
+    def _build_memory_info(self, memory: Any, swap: Any) -> dict:
+        """Build the memory information dictionary.
+
+        Args:
+            memory: Virtual memory figures, as from psutil.virtual_memory()
+            swap: Swap figures, as from psutil.swap_memory()
+
+        Returns:
+            Dictionary with memory details.
+        """
+        return {
+            "virtual": {
                 "total": memory.total,
                 "available": memory.available,
                 "used": memory.used,
+                "free": memory.free,
                 "percent": memory.percent,
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error getting memory info: {e}")
-            return {"error": str(e)}
+            },
+            "swap": {
+                "total": swap.total,
+                "used": swap.used,
+                "free": swap.free,
+                "percent": swap.percent,
+            },
+            # Backward compatibility
+            "total": memory.total,
+            "available": memory.available,
+            "used": memory.used,
+            "percent": memory.percent,
+        }
 
     def get_disk_info(self) -> dict:
         """Get disk usage information.
@@ -139,30 +359,89 @@ class SystemInfo:
         Returns:
             Dictionary with disk details.
         """
+        import psutil
+
         try:
             disk_info = {"partitions": []}
 
-            # Get all disk partitions
-            partitions = psutil.disk_partitions()
-
-            for partition in partitions:
+            # Get all disk partitions; they rarely change, so reuse the list
+            partitions = self._cached(
+                "partitions", PARTITIONS_CACHE_TTL, psutil.disk_partitions
+            )
+
+            # Query usage in parallel, so one unresponsive mount (a hung NFS
+            # share, say) only costs DISK_USAGE_TIMEOUT instead of stalling the
+            # whole call. The workers are daemon threads, so one stuck on a
+            # hung mount does not hold up interpreter exit, and a mount that
+            # is still being read is skipped, so repeated calls do not pile up
+            # more threads on it
+            work: queue.SimpleQueue[tuple[int, str]] = queue.SimpleQueue()
+            with self._disk_probes_lock:
+                for index, partition in enumerate(partitions):
+                    if partition.mountpoint not in self._disk_probes:
+                        self._disk_probes.add(partition.mountpoint)
+                        work.put((index, partition.mountpoint))
+
+            usages: dict[int, Any] = {}
+
+            def read_usages() -> None:
+                while True:
+                    try:
+                        index, mountpoint = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        usages[index] = psutil.disk_usage(mountpoint)
+                    except Exception as e:
+                        usages[index] = e
+                    finally:
+                        with self._disk_probes_lock:
+                            self._disk_probes.discard(mountpoint)
+
+            threads = [
+                threading.Thread(target=read_usages, daemon=True)
+                for _ in range(min(DISK_USAGE_WORKERS, work.qsize()))
+            ]
+            for thread in threads:
+                thread.start()
+            deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+            for thread in threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+
+            # Mounts no worker got to in time will be read on a later call
+            while True:
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    partition_info = {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "fstype": partition.fstype,
-                        "total": usage.total,
-                        "used": usage.used,
-                        "free": usage.free,
-                        "percent": (
-                            (usage.used / usage.total) * 100 if usage.total > 0 else 0
-                        ),
-                    }
-                    disk_info["partitions"].append(partition_info)
-                except (PermissionError, FileNotFoundError, OSError):
+                    _, mountpoint = work.get_nowait()
+                except queue.Empty:
+                    break
+                with self._disk_probes_lock:
+                    self._disk_probes.discard(mountpoint)
+
+            for index, partition in enumerate(partitions):
+                usage = usages.get(index)
+                if usage is None:
+                    logger.debug(
+                        "Timed out reading disk usage of %s", partition.mountpoint
+                    )
+                    continue
+                if isinstance(usage, OSError):
                     # Skip partitions that can't be accessed
                     continue
+                if isinstance(usage, Exception):
+                    raise usage
+
+                partition_info = {
+                    "device": partition.device,
+                    "mountpoint": partition.mountpoint,
+                    "fstype": partition.fstype,
+                    "total": usage.total,
+                    "used": usage.used,
+                    "free": usage.free,
+                    "percent": (
+                        (usage.used / usage.total) * 100 if usage.total > 0 else 0
+                    ),
+                }
+                disk_info["partitions"].append(partition_info)
 
             # Calculate total disk space across all partitions
             if disk_info["partitions"]:
@@ -182,7 +461,7 @@ class SystemInfo:
             return disk_info
 
         except Exception as e:
-            self.logger.error(f"Error getting disk info: {e}")
+            logger.error("Error getting disk info: %s", e)
             return {"error": str(e)}
 
     def get_network_info(self) -> dict:
@@ -191,6 +470,13 @@ class SystemInfo:
         Returns:
             Dictionary with network details.
         """
+        import psutil
+
+        now = time.monotonic()
+        if self._net_cache is not None and now - self._net_cache[0] < NETWORK_CACHE_TTL:
+            # Copy so callers can modify the result without touching the cache
+            return copy.deepcopy(self._net_cache[1])
+
         try:
             network_info = {"interfaces": []}
 
@@ -241,12 +527,13 @@ class SystemInfo:
                     "dropout": io_counters.dropout,
                 }
             except AttributeError:
-                self.logger.debug("Network I/O counters not available")
+                logger.debug("Network I/O counters not available")
 
-            return network_info
+            self._net_cache = (now, network_info)
+            return copy.deepcopy(network_info)
 
         except Exception as e:
-            self.logger.error(f"Error getting network info: {e}")
+            logger.error("Error getting network info: %s", e)
             return {"error": str(e)}
 
     def get_uptime(self) -> str:
@@ -255,29 +542,48 @@ class SystemInfo:
         Returns:
             String representation of system uptime.
         """
+        import psutil
+
+        # Linux keeps the uptime itself, saving the clock read and the boot
+        # time lookup psutil would do
+        if is_linux():
+            try:
+                return self._format_uptime(_read_proc_uptime())
+            except (OSError, ValueError, IndexError) as e:
+                logger.debug("Could not read /proc/uptime, using psutil: %s", e)
+
         try:
             boot_time = psutil.boot_time()
-            uptime_seconds = time.time() - boot_time
-            uptime_delta = timedelta(seconds=uptime_seconds)
+            return self._format_uptime(time.time() - boot_time)
 
-            # Format uptime as "X days, Y hours, Z minutes"
-            days = uptime_delta.days
-            hours, remainder = divmod(uptime_delta.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
+        except Exception as e:
+            logger.error("Error getting uptime: %s", e)
+            return f"Error: {e}"
 
-            parts = []
-            if days > 0:
-                parts.append(f"{days} day{'s' if days != 1 else ''}")
-            if hours > 0:
-                parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-            if minutes > 0:
-                parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    def _format_uptime(self, uptime_seconds: float) -> str:
+        """Format an uptime as "X days, Y hours, Z minutes".
 
-            return ", ".join(parts) if parts else "less than a minute"
+        Args:
+            uptime_seconds: Seconds since boot
 
-        except Exception as e:
-            self.logger.error(f"Error getting uptime: {e}")
-            return f"Error: {e}"
+        Returns:
+            String representation of the uptime.
+        """
+        from datetime import timedelta
+
+        uptime_delta = timedelta(seconds=uptime_seconds)
+
+        days = uptime_delta.days
+        hours, remainder = divmod(uptime_delta.seconds, 3600)
+        minutes, _ = divmod(remainder, 60)
+
+        parts = [
+            _plural(count, unit)
+            for count, unit in ((days, "day"), (hours, "hour"), (minutes, "minute"))
+            if count
+        ]
+
+        return ", ".join(parts) if parts else "less than a minute"
 
     def get_processes(self, limit: int = 10) -> dict:
         """Get information about running processes.
@@ -288,21 +594,28 @@ class SystemInfo:
         Returns:
             Dictionary with process information.
         """
+        import psutil
+
         try:
-            processes = []
+            # A process's first cpu_percent() call only starts its measurement,
+            # so prime every process, wait, and read the usage on a second pass
+            for proc in psutil.process_iter():
+                try:
+                    proc.cpu_percent()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+            time.sleep(PROCESS_CPU_SAMPLE_INTERVAL)
 
-            for proc in psutil.process_iter(
-                ["pid", "name", "username", "cpu_percent", "memory_percent"]
-            ):
+            processes = []
+            for proc in psutil.process_iter():
                 try:
-                    process_info = proc.info
-                    process_info["cpu_percent"] = proc.cpu_percent()
-                    processes.append(process_info)
+                    processes.append(proc.as_dict(attrs=_PROCESS_ATTRS))
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x.get("cpu_percent", 0), reverse=True)
+            # Sort by CPU usage; as_dict reports None where access was denied
+            processes.sort(key=lambda x: x["cpu_percent"] or 0.0, reverse=True)
 
             return {
                 "total_processes": len(processes),
@@ -310,5 +623,5 @@ class SystemInfo:
             }
 
         except Exception as e:
-            self.logger.error(f"Error getting process info: {e}")
+            logger.error("Error getting process info: %s", e)
             return {"error": str(e)}
@@ -0,0 +1,76 @@
+"""DNS resolution cache for repeated lookups of the same host."""
+
+import socket
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 900.0  # seconds
+MAX_ENTRIES = 512
+
+# (hostname, family) -> (address, expiry), kept in least-recently-used order
+_cache: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def resolve(host: str, family: int = socket.AF_UNSPEC, ttl: float = DEFAULT_TTL) -> str:
+    """Resolve a hostname to an IP address, reusing recent answers.
+
+    Args:
+        host: Hostname or IP address
+        family: Address family to resolve for, e.g. socket.AF_INET
+        ttl: Seconds a resolved address is reused before looking it up again
+
+    Returns:
+        The first address returned by getaddrinfo for the host.
+
+    Raises:
+        socket.gaierror: If the host cannot be resolved.
+    """
+    key = (host, family)
+    now = time.monotonic()
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[1] > now:
+            _cache.move_to_end(key)
+            return entry[0]
+
+    infos = socket.getaddrinfo(host, None, family, socket.SOCK_STREAM)
+    address = str(infos[0][4][0])
+
+    with _lock:
+        _cache[key] = (address, now + ttl)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    return address
+
+
+def resolve_host(host: str) -> str:
+    """Resolve a hostname through the cache, falling back to the name itself.
+
+    Used where the host is handed on to another tool: if resolution fails
+    here, that tool reports the error in its usual way. IPv6 answers are not
+    handed on either, since some tools (macOS ping, older iputils) only take
+    IPv4 literals; given the name, they pick an address themselves.
+
+    Args:
+        host: Hostname or IP address
+
+    Returns:
+        The cached or freshly resolved IPv4 address, or the host unchanged.
+    """
+    try:
+        address = resolve(host)
+    except (socket.gaierror, UnicodeError):
+        return host
+
+    return host if ":" in address else address
+
+
+def clear_dns_cache() -> None:
+    """Drop all cached DNS answers."""
+    with _lock:
+        _cache.clear()
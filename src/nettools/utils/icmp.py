@@ -0,0 +1,155 @@
+"""Unprivileged ICMP echo using datagram ICMP sockets.
+
+Linux (within ``net.ipv4.ping_group_range``) and macOS allow
+``socket(AF_INET, SOCK_DGRAM, IPPROTO_ICMP)`` without root, which lets us
+ping without raw sockets or spawning the system ``ping`` binary.
+"""
+
+import os
+import select
+import socket
+import struct
+import sys
+import time
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+
+_ICMP_HEADER = struct.Struct("!BBHHH")  # type, code, checksum, identifier, sequence
+
+# Linux assigns the identifier of datagram ICMP sockets itself (and only
+# delivers replies meant for the socket), so ours cannot be matched there
+_KERNEL_SETS_IDENT = sys.platform.startswith("linux")
+
+
+def is_available() -> bool:
+    """Check whether unprivileged ICMP sockets can be opened.
+
+    Returns:
+        True if a datagram ICMP socket could be created.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP):
+            return True
+    except OSError:
+        return False
+
+
+def checksum(data: bytes) -> int:
+    """Compute the internet checksum (RFC 1071) of some data.
+
+    Args:
+        data: Bytes to checksum
+
+    Returns:
+        16-bit one's complement checksum.
+    """
+    if len(data) % 2:
+        data += b"\x00"
+
+    total: int = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def build_echo_request(ident: int, sequence: int, payload: bytes) -> bytes:
+    """Build an ICMP echo request packet.
+
+    Args:
+        ident: Echo identifier
+        sequence: Echo sequence number
+        payload: Data to carry in the request
+
+    Returns:
+        The encoded packet, checksum included.
+    """
+    header = _ICMP_HEADER.pack(ICMP_ECHO_REQUEST, 0, 0, ident, sequence)
+    packet_checksum = checksum(header + payload)
+    return (
+        _ICMP_HEADER.pack(ICMP_ECHO_REQUEST, 0, packet_checksum, ident, sequence)
+        + payload
+    )
+
+
+def parse_echo_reply(data: bytes) -> tuple[int, int] | None:
+    """Extract the identifier and sequence number from an echo reply.
+
+    Args:
+        data: Datagram read from an ICMP socket. Linux strips the IP header,
+            macOS leaves it in place.
+
+    Returns:
+        (identifier, sequence) for echo replies, None for anything else.
+    """
+    offset = 0
+    if len(data) >= 20 and data[0] >> 4 == 4:
+        offset = (data[0] & 0x0F) * 4
+
+    if len(data) < offset + _ICMP_HEADER.size:
+        return None
+
+    icmp_type, _, _, ident, sequence = _ICMP_HEADER.unpack_from(data, offset)
+    if icmp_type != ICMP_ECHO_REPLY:
+        return None
+
+    return ident, sequence
+
+
+def echo(
+    host: str, count: int = 4, timeout: float = 5, payload_size: int = 56
+) -> list[float]:
+    """Send ICMP echo requests to a host and time the replies.
+
+    Requests are sent back to back over a single socket: the next one goes
+    out as soon as the previous reply arrives or times out. A request that
+    fails after the first is counted as lost.
+
+    Args:
+        host: Hostname or IPv4 address
+        count: Number of echo requests to send
+        timeout: Seconds to wait for each reply
+        payload_size: Size of the request payload in bytes
+
+    Returns:
+        Round-trip times in milliseconds for the replies that arrived.
+
+    Raises:
+        OSError: If the host cannot be resolved, the socket cannot be used or
+            the first request fails.
+    """
+    address = socket.gethostbyname(host)
+    ident = os.getpid() & 0xFFFF
+    payload = bytes(payload_size)
+    times = []
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP) as sock:
+        for sequence in range(1, count + 1):
+            sent_at = time.perf_counter()
+            try:
+                sock.sendto(build_echo_request(ident, sequence, payload), (address, 0))
+                deadline = sent_at + timeout
+
+                while (remaining := deadline - time.perf_counter()) > 0:
+                    ready, _, _ = select.select([sock], [], [], remaining)
+                    if not ready:
+                        break
+
+                    reply = parse_echo_reply(sock.recv(65535))
+                    if reply is None:
+                        continue
+
+                    reply_ident, reply_sequence = reply
+                    if reply_sequence == sequence and (
+                        _KERNEL_SETS_IDENT or reply_ident == ident
+                    ):
+                        times.append((time.perf_counter() - sent_at) * 1000)
+                        break
+            except OSError:
+                # A first request that fails means the socket is unusable for
+                # this host; after that, count the request as lost (as ping
+                # does) instead of throwing away the replies already timed
+                if sequence == 1:
+                    raise
+
+    return times
@@ -1,12 +1,35 @@
 """Logging utilities for nettools."""
 
+import functools
 import logging
 import sys
 
 
+class _BufferedStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the stream's own buffering.
+
+    StreamHandler flushes after every record, which is wasted work when output
+    goes to a pipe or file. Anything still buffered is flushed by
+    logging.shutdown() at exit.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the stream without flushing it."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+@functools.cache
 def get_logger(name: str | None = None) -> logging.Logger:
     """Get a configured logger instance.
 
+    Loggers are configured on first use and cached, so later calls for the
+    same name skip the handler setup check.
+
     Args:
         name: Logger name. If None, uses 'nettools' as default.
 
@@ -17,8 +40,12 @@ def get_logger(name: str | None = None) -> logging.Logger:
     logger = logging.getLogger(logger_name)
 
     if not logger.handlers:
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
+        # Create console handler; flush per record only for interactive output
+        handler: logging.Handler
+        if sys.stdout.isatty():
+            handler = logging.StreamHandler(sys.stdout)
+        else:
+            handler = _BufferedStreamHandler(sys.stdout)
         handler.setLevel(logging.INFO)
 
         # Create formatter
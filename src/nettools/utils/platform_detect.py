@@ -1,5 +1,6 @@
 """Platform detection utilities."""
 
+import functools
 import platform
 from enum import Enum
 
@@ -13,9 +14,12 @@ class PlatformType(Enum):
     UNKNOWN = "unknown"
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform() -> PlatformType:
     """Detect the current platform.
 
+    The result cannot change while the process runs, so it is computed once.
+
     Returns:
         PlatformType enum value representing the current platform.
     """
@@ -37,6 +41,13 @@ def get_platform_info() -> dict:
     Returns:
         Dictionary containing platform details.
     """
+    # Copy so callers can modify the result without touching the cache
+    return dict(_platform_info())
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> dict:
+    """Collect platform details once; some platform calls spawn processes."""
     return {
         "system": platform.system(),
         "platform": get_platform().value,
@@ -64,9 +75,12 @@ def is_macos() -> bool:
     return get_platform() == PlatformType.MACOS
 
 
+@functools.lru_cache(maxsize=1)
 def get_shell_command_prefix() -> tuple[str, ...]:
     """Get the appropriate shell command prefix for the platform.
 
+    Computed once, like get_platform.
+
     Returns:
         Tuple of command prefix parts.
     """
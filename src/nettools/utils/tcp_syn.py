@@ -0,0 +1,173 @@
+"""TCP SYN ("half-open") port scanning over raw sockets.
+
+A SYN is sent to each port and the reply read back: SYN-ACK means open, RST
+means closed. No connection is ever completed, and the local kernel answers
+each SYN-ACK with a RST, since it has no socket for the probe's source port.
+Raw TCP sockets need root (CAP_NET_RAW), and receiving TCP through them is only
+supported on Linux.
+"""
+
+import random
+import select
+import socket
+import struct
+import sys
+import time
+from collections.abc import Iterable
+
+from nettools.utils.icmp import checksum
+
+TCP_SYN = 0x02
+TCP_RST = 0x04
+TCP_ACK = 0x10
+
+# source port, destination port, sequence, acknowledgment, data offset,
+# flags, window, checksum, urgent pointer
+_TCP_HEADER = struct.Struct("!HHIIBBHHH")
+_PSEUDO_HEADER = struct.Struct("!4s4sBBH")
+
+
+def is_available() -> bool:
+    """Check whether SYN scans can be run by this process.
+
+    Returns:
+        True on Linux when a raw TCP socket can be opened.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP):
+            return True
+    except OSError:
+        return False
+
+
+def source_address(address: str) -> str:
+    """Find the local address the kernel would use to reach an address.
+
+    Args:
+        address: Destination IPv4 address
+
+    Returns:
+        Local IPv4 address of the outgoing interface.
+    """
+    # Connecting a UDP socket only selects a route; nothing is sent
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.connect((address, 9))
+        return str(sock.getsockname()[0])
+
+
+def build_syn(
+    source: str, destination: str, source_port: int, port: int, sequence: int
+) -> bytes:
+    """Build a TCP SYN segment, checksum included.
+
+    Args:
+        source: Local IPv4 address the segment is sent from
+        destination: Target IPv4 address
+        source_port: Local port the segment is sent from
+        port: Target port
+        sequence: Initial sequence number
+
+    Returns:
+        The encoded TCP header. The kernel adds the IP header.
+    """
+    fields = [source_port, port, sequence, 0, 5 << 4, TCP_SYN, 64240, 0, 0]
+    pseudo_header = _PSEUDO_HEADER.pack(
+        socket.inet_aton(source),
+        socket.inet_aton(destination),
+        0,
+        socket.IPPROTO_TCP,
+        _TCP_HEADER.size,
+    )
+    fields[7] = checksum(pseudo_header + _TCP_HEADER.pack(*fields))
+    return _TCP_HEADER.pack(*fields)
+
+
+def parse_reply(data: bytes) -> tuple[str, int, int, int, int] | None:
+    """Extract the fields needed to match a reply to a SYN probe.
+
+    Args:
+        data: IPv4 packet read from a raw TCP socket
+
+    Returns:
+        (source address, source port, destination port, acknowledgment number,
+        flags), or None if the packet is not TCP over IPv4.
+    """
+    if len(data) < 20 or data[0] >> 4 != 4 or data[9] != socket.IPPROTO_TCP:
+        return None
+
+    offset = (data[0] & 0x0F) * 4
+    if len(data) < offset + _TCP_HEADER.size:
+        return None
+
+    source_port, port, _, ack, _, flags, _, _, _ = _TCP_HEADER.unpack_from(data, offset)
+    return socket.inet_ntoa(data[12:16]), source_port, port, ack, flags
+
+
+def scan(
+    address: str, ports: Iterable[int], timeout: float = 5
+) -> dict[int, tuple[bool, float]]:
+    """SYN scan ports on a host.
+
+    All SYNs are sent up front, then replies are collected until every port
+    has answered or the timeout expires.
+
+    Args:
+        address: Target IPv4 address
+        ports: Port numbers to probe
+        timeout: Seconds to wait for replies after the last SYN is sent
+
+    Returns:
+        Mapping of each port that replied to (open, response time in seconds).
+        Ports that did not reply are filtered or unreachable.
+
+    Raises:
+        OSError: If the raw socket cannot be opened or used.
+    """
+    source = source_address(address)
+    source_port = random.randint(32768, 60999)
+    sequence = random.getrandbits(32)
+    expected_ack = (sequence + 1) & 0xFFFFFFFF
+
+    wanted = set(ports)
+    sent_at: dict[int, float] = {}
+    replies: dict[int, tuple[bool, float]] = {}
+
+    with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP) as sock:
+        for port in wanted:
+            sent_at[port] = time.perf_counter()
+            sock.sendto(
+                build_syn(source, address, source_port, port, sequence), (address, 0)
+            )
+
+        deadline = time.perf_counter() + timeout
+        while len(replies) < len(wanted):
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+
+            ready, _, _ = select.select([sock], [], [], remaining)
+            if not ready:
+                break
+
+            reply = parse_reply(sock.recv(65535))
+            if reply is None:
+                continue
+
+            reply_source, port, reply_port, ack, flags = reply
+            if (
+                reply_source != address
+                or reply_port != source_port
+                or port not in wanted
+                or port in replies
+                or ack != expected_ack
+            ):
+                continue
+
+            is_open = flags & (TCP_SYN | TCP_ACK) == TCP_SYN | TCP_ACK
+            if is_open or flags & TCP_RST:
+                replies[port] = (is_open, time.perf_counter() - sent_at[port])
+
+    return replies
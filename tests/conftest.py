@@ -4,6 +4,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from nettools.utils import platform_detect
+
 # Common test fixtures and utilities
 
 
@@ -17,8 +19,16 @@ def mock_subprocess_run():
 @pytest.fixture
 def mock_platform_system():
     """Mock platform.system for testing."""
+    # Platform detection is cached, so drop the real result before and the
+    # mocked one after
+    platform_detect.get_platform.cache_clear()
+    platform_detect.get_shell_command_prefix.cache_clear()
+    platform_detect._platform_info.cache_clear()
     with patch("platform.system") as mock_system:
         yield mock_system
+    platform_detect.get_platform.cache_clear()
+    platform_detect.get_shell_command_prefix.cache_clear()
+    platform_detect._platform_info.cache_clear()
 
 
 @pytest.fixture
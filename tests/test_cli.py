@@ -67,7 +67,44 @@ class TestCLI:
         output_data = json.loads(json_output)
         assert output_data == expected_result
 
-    @patch("nettools.core.ports.PortChecker.check_ports")
+    @patch("nettools.cli.main._HAS_ORJSON", False)
+    @patch("nettools.core.ping.PingWrapper.ping")
+    def test_ping_host_json_output_without_orjson(self, mock_ping):
+        """Test JSON output falls back to the standard library encoder."""
+        expected_result = {"host": "example.com", "packet_loss": 0.0}
+        mock_ping.return_value = expected_result
+
+        result = self.runner.invoke(app, ["ping-host", "example.com", "--json"])
+        assert result.exit_code == 0
+        json_output = result.stdout[result.stdout.index("{") :]
+        assert json.loads(json_output) == expected_result
+
+    @patch("nettools.core.ping.PingWrapper.ping_many")
+    def test_ping_hosts_command(self, mock_ping_many):
+        """Test ping-hosts command."""
+        mock_ping_many.return_value = {
+            "8.8.8.8": {
+                "host": "8.8.8.8",
+                "packets_sent": 4,
+                "packets_received": 4,
+                "packet_loss": 0.0,
+                "avg_time": 20.5,
+            },
+            "1.1.1.1": {
+                "host": "1.1.1.1",
+                "packets_sent": 4,
+                "packets_received": 0,
+                "packet_loss": 100.0,
+                "avg_time": None,
+            },
+        }
+
+        result = self.runner.invoke(app, ["ping-hosts", "8.8.8.8, 1.1.1.1"])
+        assert result.exit_code == 0
+        mock_ping_many.assert_called_once()
+        assert mock_ping_many.call_args.kwargs["hosts"] == ["8.8.8.8", "1.1.1.1"]
+
+    @patch("nettools.core.ports.PortChecker.check_ports_async")
     def test_check_ports_command(self, mock_check_ports):
         """Test check-ports command."""
         mock_check_ports.return_value = {
@@ -115,6 +152,22 @@ class TestCLI:
         result = self.runner.invoke(app, ["iperf3-run", "--client", "192.168.1.5"])
         assert result.exit_code == 0
         mock_run_client.assert_called_once()
+        assert mock_run_client.call_args.kwargs["parallel"] == 1
+        assert mock_run_client.call_args.kwargs["reverse"] is False
+
+    @patch("nettools.core.iperf3.IPerf3Wrapper._check_iperf3_availability")
+    @patch("nettools.core.iperf3.IPerf3Wrapper.run_client")
+    def test_iperf3_client_parallel_reverse(self, mock_run_client, mock_check_iperf3):
+        """Test iperf3-run passes parallel streams and reverse mode through."""
+        mock_check_iperf3.return_value = None
+        mock_run_client.return_value = {"mode": "client", "bandwidth": 940.0}
+
+        result = self.runner.invoke(
+            app, ["iperf3-run", "--client", "192.168.1.5", "-P", "4", "--reverse"]
+        )
+        assert result.exit_code == 0
+        assert mock_run_client.call_args.kwargs["parallel"] == 4
+        assert mock_run_client.call_args.kwargs["reverse"] is True
 
     @patch("nettools.core.iperf3.IPerf3Wrapper._check_iperf3_availability")
     def test_iperf3_no_mode_error(self, mock_check_iperf3):
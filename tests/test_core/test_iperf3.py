@@ -2,9 +2,20 @@
 
 import json
 import subprocess
+import sys
+import threading
+import tracemalloc
 from unittest.mock import Mock, patch
 
-from nettools.core.iperf3 import IPerf3Wrapper
+import pytest
+
+from nettools.core.iperf3 import (
+    IPerf3Wrapper,
+    _iperf3_available,
+    _load_libiperf,
+    _summarize_report,
+    _summarize_report_fast,
+)
 
 
 class TestIPerf3Wrapper:
@@ -12,28 +23,42 @@ class TestIPerf3Wrapper:
 
     def setup_method(self):
         """Set up test environment."""
+        _iperf3_available.cache_clear()
         with patch.object(IPerf3Wrapper, "_check_iperf3_availability"):
             self.iperf3 = IPerf3Wrapper()
 
+    def teardown_method(self):
+        """Clean up test environment."""
+        _iperf3_available.cache_clear()
+        _load_libiperf.cache_clear()
+
+    @patch("shutil.which", return_value="/usr/bin/iperf3")
     @patch("subprocess.run")
-    def test_check_iperf3_availability_success(self, mock_run):
+    def test_check_iperf3_availability_success(self, mock_run, _mock_which):
         """Test successful iperf3 availability check."""
-        mock_run.return_value.returncode = 0
-        
         # Should not raise an exception
         wrapper = IPerf3Wrapper()
         assert wrapper is not None
+        mock_run.assert_not_called()
 
+    @patch("shutil.which", return_value=None)
     @patch("subprocess.run")
-    def test_check_iperf3_availability_failure(self, mock_run):
-        """Test iperf3 availability check failure."""
-        mock_run.side_effect = FileNotFoundError()
-        
+    def test_check_iperf3_availability_failure(self, mock_run, _mock_which):
+        """Test a missing binary is detected without spawning a process."""
         try:
             IPerf3Wrapper()
             assert False, "Should have raised RuntimeError"
         except RuntimeError as e:
             assert "iperf3 is not installed" in str(e)
+        mock_run.assert_not_called()
+
+    @patch("shutil.which", return_value="/usr/bin/iperf3")
+    def test_check_iperf3_availability_cached(self, mock_which):
+        """Test the availability check runs once per process."""
+        IPerf3Wrapper()
+        IPerf3Wrapper()
+
+        mock_which.assert_called_once_with("iperf3")
 
     def test_run_server(self):
         """Test running iperf3 in server mode."""
@@ -49,12 +74,29 @@ class TestIPerf3Wrapper:
             assert result["status"] == "running"
             assert result["pid"] == 12345
 
-    @patch("subprocess.run")
-    def test_run_client_success(self, mock_run):
+            kwargs = mock_popen.call_args.kwargs
+            assert kwargs["stdout"] == subprocess.DEVNULL
+            assert kwargs["stderr"] == subprocess.DEVNULL
+            assert kwargs["start_new_session"] is True
+
+    def test_run_server_log_file(self):
+        """Test server output can be sent to a log file."""
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.pid = 12345
+
+            result = self.iperf3.run_server(log_file="/tmp/iperf3.log")
+
+            cmd = mock_popen.call_args[0][0]
+            assert cmd[-2:] == ["--logfile", "/tmp/iperf3.log"]
+            assert result["log_file"] == "/tmp/iperf3.log"
+
+    @patch("subprocess.Popen")
+    def test_run_client_success(self, mock_popen):
         """Test successful iperf3 client run."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps({
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.returncode = 0
+        mock_process.communicate.return_value = (b"{...}", b"")
+        report = {
             "start": {"connecting_to": {"host": "192.168.1.5", "port": 5201}},
             "end": {
                 "sum_received": {
@@ -65,27 +107,217 @@ class TestIPerf3Wrapper:
                 "sum_sent": {"retransmits": 0},
                 "cpu_utilization_percent": {"host_total": 5.0, "remote_total": 3.0}
             }
-        })
-        mock_run.return_value = mock_result
-        
-        result = self.iperf3.run_client("192.168.1.5")
-        
+        }
+
+        # Hand the report over at the decoding seam; parsing is covered by
+        # the stdlib json and byte-parsing tests
+        with patch.object(
+            IPerf3Wrapper, "_decode_stdout", return_value=report
+        ) as mock_decode:
+            result = self.iperf3.run_client("192.168.1.5")
+
+        mock_decode.assert_called_once_with(b"{...}", False)
+
         assert result["mode"] == "client"
         assert result["host"] == "192.168.1.5"
         assert result["port"] == 5201
         assert result["duration"] == 10.0
         assert result["bandwidth"] == 800.0  # 800 Mbits/sec
 
-    @patch("subprocess.run")
-    def test_run_client_timeout(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_run_client_reverse_flag(self, mock_popen):
+        """Test --reverse is passed only for reverse-mode runs."""
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.returncode = 0
+        mock_process.communicate.return_value = (b"{}", b"")
+
+        with patch.object(IPerf3Wrapper, "_decode_stdout", return_value={}):
+            self.iperf3.run_client("192.168.1.5")
+            self.iperf3.run_client("192.168.1.5", reverse=True)
+
+        forward, reverse = (call.args[0] for call in mock_popen.call_args_list)
+        assert "--reverse" not in forward
+        assert reverse[-1] == "--reverse"
+
+    @patch("nettools.core.iperf3._json", json)
+    @patch("subprocess.Popen")
+    def test_run_client_stdlib_json(self, mock_popen):
+        """Test the report parses as bytes when orjson is not installed."""
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.returncode = 0
+        mock_process.communicate.return_value = (
+            json.dumps(
+                {"end": {"sum_received": {"bits_per_second": 500000000}}}
+            ).encode(),
+            b"",
+        )
+
+        result = self.iperf3.run_client("192.168.1.5")
+
+        assert result["bandwidth"] == 500.0
+
+    @patch("nettools.core.iperf3._json", json)
+    @patch("subprocess.Popen")
+    def test_run_client_stdlib_json_invalid(self, mock_popen):
+        """Test unparsable output falls back to text parsing with stdlib json."""
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.returncode = 0
+        mock_process.communicate.return_value = (b"not json", b"")
+
+        result = self.iperf3.run_client("192.168.1.5")
+
+        assert result["raw_output"] == "not json"
+
+    @patch("subprocess.Popen")
+    def test_run_client_stream(self, mock_popen):
+        """Test --json-stream events are parsed as they arrive."""
+        events = [
+            {
+                "event": "start",
+                "data": {"connecting_to": {"host": "192.168.1.5", "port": 5201}},
+            },
+            {
+                "event": "interval",
+                "data": {"sum": {"start": 0, "end": 1, "bits_per_second": 9.4e8}},
+            },
+            {
+                "event": "end",
+                "data": {
+                    "sum_sent": {"retransmits": 2},
+                    "sum_received": {
+                        "seconds": 1.0,
+                        "bytes": 117500000,
+                        "bits_per_second": 940000000,
+                    },
+                },
+            },
+        ]
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.returncode = 0
+        mock_process.stdout = iter(json.dumps(e).encode() + b"\n" for e in events)
+        mock_process.stderr.read.return_value = b""
+
+        result = self.iperf3.run_client("192.168.1.5", stream=True, include_raw=True)
+
+        assert "--json-stream" in mock_popen.call_args[0][0]
+        assert result["host"] == "192.168.1.5"
+        assert result["bandwidth"] == 940.0
+        assert result["retransmits"] == 2
+        assert len(result["raw_result"]["intervals"]) == 1
+
+    @patch("subprocess.Popen")
+    def test_run_client_stream_error(self, mock_popen):
+        """Test a --json-stream error event is raised."""
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.stdout = iter(
+            [b'{"event": "error", "data": "unable to connect to server"}\n']
+        )
+        mock_process.stderr.read.return_value = b""
+
+        try:
+            self.iperf3.run_client("192.168.1.5", stream=True)
+            assert False, "Should have raised RuntimeError"
+        except RuntimeError as e:
+            assert "unable to connect to server" in str(e)
+
+    @staticmethod
+    def fake_libiperf(report):
+        """Create a mock libiperf whose client run hands back a report."""
+        lib = Mock()
+
+        def run_client(test):
+            on_json = lib.iperf_set_test_json_callback.call_args.args[1]
+            on_json(None, json.dumps(report).encode())
+            return 0
+
+        lib.iperf_run_client.side_effect = run_client
+        return lib
+
+    @patch("shutil.which", return_value=None)
+    @patch("subprocess.Popen")
+    def test_run_client_libiperf(self, mock_popen, _mock_which):
+        """Test client runs go through libiperf, without the binary."""
+        lib = self.fake_libiperf(
+            {
+                "start": {"connecting_to": {"host": "192.168.1.5", "port": 5201}},
+                "end": {"sum_received": {"bits_per_second": 800000000}},
+            }
+        )
+        with patch("nettools.core.iperf3._load_libiperf", return_value=lib):
+            wrapper = IPerf3Wrapper(use_libiperf=True)
+
+        result = wrapper.run_client("192.168.1.5", parallel=4, reverse=True)
+
+        mock_popen.assert_not_called()
+        test = lib.iperf_new_test.return_value
+        lib.iperf_set_test_num_streams.assert_called_once_with(test, 4)
+        lib.iperf_set_test_reverse.assert_called_once_with(test, 1)
+        lib.iperf_free_test.assert_called_once_with(test)
+        assert result["host"] == "192.168.1.5"
+        assert result["bandwidth"] == 800.0
+
+    @patch("nettools.core.iperf3._CLIENT_TIMEOUT_GRACE", 0.05)
+    def test_run_client_libiperf_timeout(self):
+        """Test a stalled libiperf run is given up on after the deadline."""
+        lib = Mock()
+        released = threading.Event()
+        lib.iperf_run_client.side_effect = lambda test: released.wait(5) and 0
+        with patch("nettools.core.iperf3._load_libiperf", return_value=lib):
+            wrapper = IPerf3Wrapper(use_libiperf=True)
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            wrapper.run_client("192.168.1.5", duration=0)
+
+        # The test is freed once the library returns, not while it runs
+        lib.iperf_free_test.assert_not_called()
+        released.set()
+
+    @patch("shutil.which", return_value=None)
+    def test_run_client_libiperf_stream_needs_binary(self, _mock_which):
+        """Test streamed runs, which use the binary, check for it."""
+        with patch("nettools.core.iperf3._load_libiperf", return_value=Mock()):
+            wrapper = IPerf3Wrapper(use_libiperf=True)
+
+        with pytest.raises(RuntimeError, match="iperf3 is not installed"):
+            wrapper.run_client("192.168.1.5", stream=True)
+
+    @patch("ctypes.util.find_library", return_value=None)
+    @patch("ctypes.CDLL", side_effect=OSError("not found"))
+    def test_libiperf_missing(self, _mock_cdll, _mock_find_library):
+        """Test the binary is used when libiperf is not installed."""
+        with patch.object(IPerf3Wrapper, "_check_iperf3_availability"):
+            wrapper = IPerf3Wrapper(use_libiperf=True)
+
+        assert wrapper._libiperf is None
+
+    @patch("subprocess.Popen")
+    def test_run_client_failure(self, mock_popen):
+        """Test iperf3 client reporting an error."""
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.returncode = 1
+        mock_process.communicate.return_value = (b"", b"unable to connect to server")
+
+        try:
+            self.iperf3.run_client("192.168.1.5")
+            assert False, "Should have raised RuntimeError"
+        except RuntimeError as e:
+            assert "unable to connect to server" in str(e)
+
+    @patch("subprocess.Popen")
+    def test_run_client_timeout(self, mock_popen):
         """Test iperf3 client timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired("iperf3", 30)
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.communicate.side_effect = [
+            subprocess.TimeoutExpired("iperf3", 30),
+            (b"", b""),
+        ]
         
         try:
             self.iperf3.run_client("192.168.1.5")
             assert False, "Should have raised RuntimeError"
         except RuntimeError as e:
             assert "timed out" in str(e)
+        mock_process.kill.assert_called_once()
 
     def test_parse_client_result(self):
         """Test parsing iperf3 client results."""
@@ -110,4 +342,195 @@ class TestIPerf3Wrapper:
         assert result["duration"] == 10.0
         assert result["bytes_transferred"] == 1250000000
         assert result["bandwidth"] == 1000.0  # 1000 Mbits/sec
-        assert result["retransmits"] == 2
\ No newline at end of file
+        assert result["retransmits"] == 2
+        assert "raw_result" not in result
+
+        result = self.iperf3._parse_client_result(raw_result, include_raw=True)
+        assert result["raw_result"] is raw_result
+
+    def test_parse_client_result_streams(self):
+        """Test parallel runs report the bandwidth of each stream."""
+        raw_result = {
+            "end": {
+                "streams": [
+                    {"receiver": {"bits_per_second": 300000000}},
+                    {"receiver": {"bits_per_second": 500000000}},
+                ],
+                "sum_received": {"bits_per_second": 800000000},
+            }
+        }
+
+        result = self.iperf3._parse_client_result(raw_result)
+
+        assert result["bandwidth"] == 800.0
+        assert result["stream_bandwidths"] == [300.0, 500.0]
+
+    def test_parse_client_result_complete_report(self):
+        """Test complete reports summarize the same on the fixed-layout path."""
+        raw_result = {
+            "start": {"connecting_to": {"host": "test.com", "port": 5201}},
+            "end": {
+                "streams": [
+                    {
+                        "sender": {"bits_per_second": 1010000000},
+                        "receiver": {"bits_per_second": 1000000000},
+                    }
+                ],
+                "sum_sent": {"retransmits": 2},
+                "sum_received": {
+                    "seconds": 10.0,
+                    "bytes": 1250000000,
+                    "bits_per_second": 1000000000,
+                },
+                "cpu_utilization_percent": {"host_total": 10.0, "remote_total": 8.0},
+            },
+        }
+
+        result = self.iperf3._parse_client_result(raw_result)
+
+        assert result == _summarize_report_fast(raw_result)
+        assert result == _summarize_report(raw_result)
+        assert result["stream_bandwidths"] == [1000.0]
+
+    def test_parse_client_result_bytes(self):
+        """Test reports are parsed straight from iperf3's output bytes."""
+        output = json.dumps(
+            {
+                "start": {"connecting_to": {"host": "test.com", "port": 5201}},
+                "end": {"sum_received": {"bits_per_second": 250000000}},
+            }
+        ).encode()
+
+        with patch("nettools.core.iperf3.ijson", None):
+            result = self.iperf3._parse_client_result(output)
+
+        assert result["host"] == "test.com"
+        assert result["bandwidth"] == 250.0
+
+    @patch("nettools.core.iperf3._HAVE_ORJSON", True)
+    def test_parse_client_result_prefers_orjson(self):
+        """Test buffered reports get one orjson pass even with ijson installed."""
+        output = json.dumps(
+            {
+                "start": {"connecting_to": {"host": "test.com", "port": 5201}},
+                "end": {"sum_received": {"bits_per_second": 250000000}},
+            }
+        ).encode()
+        ijson = Mock()
+
+        with patch("nettools.core.iperf3.ijson", ijson):
+            result = self.iperf3._parse_client_result(output)
+
+        ijson.items.assert_not_called()
+        assert result["bandwidth"] == 250.0
+
+    def test_parse_client_result_ijson_skips_intervals(self):
+        """Test only the summary sections are built by ijson without orjson."""
+        pytest.importorskip("ijson")
+        interval = {"streams": [{"bits_per_second": 9.4e8, "bytes": 117500000}]}
+        output = json.dumps(
+            {
+                "start": {"connecting_to": {"host": "test.com", "port": 5201}},
+                "intervals": [interval] * 10000,
+                "end": {
+                    "sum_received": {"seconds": 10.0, "bits_per_second": 1e9},
+                    "sum_sent": {"retransmits": 3},
+                },
+            }
+        ).encode()
+
+        tracemalloc.start()
+        try:
+            with patch("nettools.core.iperf3._HAVE_ORJSON", False):
+                result = self.iperf3._parse_client_result(output)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert result["host"] == "test.com"
+        assert result["bandwidth"] == 1000.0
+        assert result["retransmits"] == 3
+        assert peak < len(output)
+
+    def test_parse_text_output(self):
+        """Test the text fallback parser picks up the sender bandwidth."""
+        output = (
+            "[ ID] Interval           Transfer     Bitrate         Retr\n"
+            "[  5]   0.00-10.00  sec  1.10 GBytes   943 Mbits/sec    0   sender\n"
+            "[  5]   0.00-10.04  sec  1.10 GBytes   939 Mbits/sec        receiver\n"
+        )
+
+        result = self.iperf3._parse_text_output(output)
+
+        assert result["mode"] == "client"
+        assert result["bandwidth"] == 943.0
+
+
+# Stand-in for iperf3 that floods stderr well past a pipe buffer, then writes
+# its report to stdout
+CHATTY_IPERF3 = """
+import json, sys
+sys.stderr.write("warning: " + "x" * 200_000 + "\\n")
+sys.stderr.flush()
+stream = "--json-stream" in sys.argv
+end = {"sum_received": {"bits_per_second": 100000000}}
+if stream:
+    print(json.dumps({"event": "end", "data": end}))
+else:
+    print(json.dumps({"end": end}))
+"""
+
+STALLED_IPERF3 = "import time; time.sleep(30)"
+
+
+def fake_iperf3(script):
+    """Patch Popen so the iperf3 command runs a Python script instead."""
+    real_popen = subprocess.Popen
+
+    def popen(cmd, **kwargs):
+        return real_popen([sys.executable, "-c", script, *cmd[1:]], **kwargs)
+
+    return patch("subprocess.Popen", side_effect=popen)
+
+
+class TestIPerf3WrapperSubprocess:
+    """Test IPerf3Wrapper.run_client against real child processes."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        with patch.object(IPerf3Wrapper, "_check_iperf3_availability"):
+            self.iperf3 = IPerf3Wrapper()
+
+    def test_run_client_large_stderr(self):
+        """Test a client flooding stderr does not deadlock on its pipes."""
+        with fake_iperf3(CHATTY_IPERF3):
+            result = self.iperf3.run_client("127.0.0.1", duration=1)
+
+        assert result["bandwidth"] == 100.0
+
+    def test_run_client_stream_large_stderr(self):
+        """Test streamed runs drain stderr while reading events."""
+        with fake_iperf3(CHATTY_IPERF3):
+            result = self.iperf3.run_client("127.0.0.1", duration=1, stream=True)
+
+        assert result["bandwidth"] == 100.0
+
+    @patch("nettools.core.iperf3._CLIENT_TIMEOUT_GRACE", 0)
+    def test_run_client_stalled(self):
+        """Test a client that never finishes is killed at the deadline."""
+        with fake_iperf3(STALLED_IPERF3):
+            try:
+                self.iperf3.run_client("127.0.0.1", duration=1)
+                assert False, "Should have raised RuntimeError"
+            except RuntimeError as e:
+                assert "timed out" in str(e)
+
+    @patch("nettools.core.iperf3._CLIENT_TIMEOUT_GRACE", 0)
+    def test_run_client_stream_stalled(self):
+        """Test streamed runs are killed at the deadline too."""
+        with fake_iperf3(STALLED_IPERF3):
+            try:
+                self.iperf3.run_client("127.0.0.1", duration=1, stream=True)
+                assert False, "Should have raised RuntimeError"
+            except RuntimeError as e:
+                assert "timed out" in str(e)
@@ -0,0 +1,303 @@
+"""Tests for ping wrapper functionality."""
+
+import socket
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from nettools.core.ping import PingWrapper
+
+UNIX_PING_OUTPUT = """PING 8.8.8.8 (8.8.8.8) 56(84) bytes of data.
+64 bytes from 8.8.8.8: icmp_seq=1 ttl=117 time=19.6 ms
+64 bytes from 8.8.8.8: icmp_seq=2 ttl=117 time=20.4 ms
+
+--- 8.8.8.8 ping statistics ---
+2 packets transmitted, 2 received, 0% packet loss, time 1001ms
+"""
+
+WINDOWS_PING_OUTPUT = """Pinging 8.8.8.8 with 32 bytes of data:
+Reply from 8.8.8.8: bytes=32 time=20ms TTL=117
+Reply from 8.8.8.8: bytes=32 time<1ms TTL=117
+Request timed out.
+
+Ping statistics for 8.8.8.8:
+    Packets: Sent = 3, Received = 2, Lost = 1 (33% loss),
+Approximate round trip times in milli-seconds:
+    Minimum = 0ms, Maximum = 20ms, Average = 10ms
+"""
+
+
+class FakeICMPLibError(Exception):
+    """Stand-in for icmplib.ICMPLibError."""
+
+
+class TestPingWrapper:
+    """Test cases for PingWrapper functionality."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.ping = PingWrapper()
+        self.ping._use_dgram_icmp = False
+        self.icmplib = Mock()
+        self.icmplib.ICMPLibError = FakeICMPLibError
+
+    def _enable_icmplib(self):
+        self.ping._icmplib = self.icmplib
+        self.ping._privileged = True
+        self.ping._use_icmplib = True
+
+    def test_ping_icmplib(self):
+        """Test pinging through icmplib when raw sockets are available."""
+        self._enable_icmplib()
+        self.icmplib.ping.return_value = SimpleNamespace(
+            packets_sent=4,
+            packets_received=3,
+            packet_loss=0.25,
+            min_rtt=10.0,
+            avg_rtt=15.0,
+            max_rtt=20.0,
+            rtts=[10.0, 15.0, 20.0],
+        )
+
+        with patch("subprocess.run") as mock_run:
+            result = self.ping.ping("8.8.8.8", count=4, timeout=2)
+
+        mock_run.assert_not_called()
+        self.icmplib.ping.assert_called_once_with(
+            "8.8.8.8", count=4, timeout=2, privileged=True
+        )
+        assert result["host"] == "8.8.8.8"
+        assert result["packets_sent"] == 4
+        assert result["packets_received"] == 3
+        assert result["packet_loss"] == 25.0
+        assert result["times"] == [10.0, 15.0, 20.0]
+        assert result["min_time"] == 10.0
+        assert result["avg_time"] == 15.0
+        assert result["max_time"] == 20.0
+
+    def test_ping_icmplib_no_replies(self):
+        """Test icmplib results for an unreachable host."""
+        self._enable_icmplib()
+        self.icmplib.ping.return_value = SimpleNamespace(
+            packets_sent=4,
+            packets_received=0,
+            packet_loss=1.0,
+            min_rtt=0.0,
+            avg_rtt=0.0,
+            max_rtt=0.0,
+            rtts=[],
+        )
+
+        result = self.ping.ping("10.255.255.1")
+
+        assert result["packet_loss"] == 100.0
+        assert result["avg_time"] is None
+
+    def test_ping_icmplib_error(self):
+        """Test icmplib errors are reported in the result."""
+        self._enable_icmplib()
+        self.icmplib.ping.side_effect = FakeICMPLibError("Name lookup failed")
+
+        result = self.ping.ping("invalid.host", use_dns_cache=False)
+
+        assert result["packets_received"] == 0
+        assert result["packet_loss"] == 100.0
+        assert "Name lookup failed" in result["error"]
+
+    @patch("nettools.core.ping.icmp.echo")
+    def test_ping_dgram_icmp(self, mock_echo):
+        """Test pinging over an unprivileged ICMP socket."""
+        self.ping._use_dgram_icmp = True
+        mock_echo.return_value = [10.0, 20.0, 30.0]
+
+        with patch("subprocess.run") as mock_run:
+            result = self.ping.ping("8.8.8.8", count=4, timeout=2)
+
+        mock_run.assert_not_called()
+        mock_echo.assert_called_once_with("8.8.8.8", count=4, timeout=2)
+        assert result["packets_sent"] == 4
+        assert result["packets_received"] == 3
+        assert result["packet_loss"] == 25.0
+        assert result["min_time"] == 10.0
+        assert result["avg_time"] == 20.0
+        assert result["max_time"] == 30.0
+
+    @patch("nettools.core.ping.resolve_host")
+    @patch("nettools.core.ping.resolve", return_value="93.184.216.34")
+    @patch("nettools.core.ping.icmp.echo")
+    def test_ping_dgram_icmp_resolves_ipv4(self, mock_echo, mock_resolve, mock_host):
+        """Test the ICMP socket is given an IPv4 address for the host."""
+        self.ping._use_dgram_icmp = True
+        mock_echo.return_value = [10.0]
+
+        result = self.ping.ping("example.com", count=1)
+
+        mock_resolve.assert_called_once_with("example.com", socket.AF_INET)
+        mock_host.assert_not_called()
+        mock_echo.assert_called_once_with("93.184.216.34", count=1, timeout=5)
+        assert result["packets_received"] == 1
+
+    @patch("nettools.core.ping._IS_WINDOWS", False)
+    @patch("subprocess.run")
+    @patch("nettools.core.ping.icmp.echo")
+    def test_ping_dgram_icmp_falls_back(self, mock_echo, mock_run):
+        """Test socket errors fall through to the system ping binary."""
+        self.ping._use_dgram_icmp = True
+        self.ping._use_icmplib = False
+        mock_echo.side_effect = PermissionError("Permission denied")
+        mock_run.return_value = Mock(stdout=UNIX_PING_OUTPUT, stderr="")
+
+        result = self.ping.ping("8.8.8.8", count=2)
+
+        mock_run.assert_called_once()
+        assert result["packets_received"] == 2
+
+    @patch("nettools.core.ping._IS_WINDOWS", False)
+    @patch("subprocess.run")
+    @patch("nettools.core.ping.icmp.echo")
+    def test_ping_dgram_icmp_invalid_name(self, mock_echo, mock_run):
+        """Test a name that is not valid IDNA falls through to the usual error."""
+        self.ping._use_dgram_icmp = True
+        self.ping._use_icmplib = False
+        mock_run.return_value = Mock(
+            stdout="", stderr="ping: unknown host", returncode=2
+        )
+        host = "x" * 64 + ".com"
+
+        self.ping.ping(host, count=1)
+
+        mock_echo.assert_not_called()
+        assert mock_run.call_args[0][0][-1] == host
+
+    @patch("nettools.core.ping._IS_WINDOWS", False)
+    @patch("subprocess.run")
+    def test_ping_subprocess_fallback(self, mock_run):
+        """Test falling back to the system ping binary."""
+        self.ping._use_icmplib = False
+        mock_run.return_value = Mock(stdout=UNIX_PING_OUTPUT, stderr="")
+
+        result = self.ping.ping("8.8.8.8", count=2)
+
+        mock_run.assert_called_once()
+        assert result["packets_received"] == 2
+        assert result["packet_loss"] == 0.0
+        assert result["times"] == [19.6, 20.4]
+        assert result["min_time"] == 19.6
+        assert result["max_time"] == 20.4
+
+    def test_build_ping_command(self):
+        """Test the ping command line for each platform."""
+        with patch("nettools.core.ping._IS_WINDOWS", False):
+            cmd = self.ping._build_ping_command("8.8.8.8", 4, 5, None)
+        assert cmd == ["ping", "-c", "4", "-W", "5", "8.8.8.8"]
+
+        with patch("nettools.core.ping._IS_WINDOWS", True):
+            cmd = self.ping._build_ping_command("8.8.8.8", 4, 5, 64)
+        assert cmd == ["ping", "-n", "4", "-w", "5000", "-l", "64", "8.8.8.8"]
+
+    def test_parse_unix_ping(self):
+        """Test parsing Unix ping output."""
+        result = self.ping._parse_unix_ping(UNIX_PING_OUTPUT)
+
+        assert result["packets_received"] == 2
+        assert result["packet_loss"] == 0.0
+        assert result["avg_time"] == 20.0
+
+    def test_parse_windows_ping(self):
+        """Test parsing Windows ping output."""
+        result = self.ping._parse_windows_ping(WINDOWS_PING_OUTPUT)
+
+        assert result["times"] == [20.0, 1.0]
+        assert result["packets_received"] == 2
+        assert result["packet_loss"] == 33.0
+        assert result["min_time"] == 1.0
+        assert result["max_time"] == 20.0
+
+    @patch("nettools.core.ping.resolve_host", return_value="93.184.216.34")
+    @patch("nettools.core.ping._IS_WINDOWS", False)
+    @patch("subprocess.run")
+    def test_ping_uses_dns_cache(self, mock_run, mock_resolve):
+        """Test the resolved address is passed to the ping binary."""
+        self.ping._use_icmplib = False
+        mock_run.return_value = Mock(stdout=UNIX_PING_OUTPUT, stderr="")
+
+        result = self.ping.ping("example.com", count=2)
+
+        mock_resolve.assert_called_once_with("example.com")
+        assert mock_run.call_args[0][0][-1] == "93.184.216.34"
+        assert result["host"] == "example.com"
+
+    @patch("socket.getaddrinfo")
+    @patch("nettools.core.ping._IS_WINDOWS", False)
+    @patch("subprocess.run")
+    def test_ping_ipv6_answer_passes_name(self, mock_run, mock_getaddrinfo):
+        """Test an IPv6 answer is not handed to an IPv4-only ping binary."""
+        self.ping._use_icmplib = False
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 0, 0, 0))
+        ]
+        mock_run.return_value = Mock(stdout=UNIX_PING_OUTPUT, stderr="")
+
+        self.ping.ping("localhost6", count=2)
+
+        assert mock_run.call_args[0][0][-1] == "localhost6"
+
+    @patch("nettools.core.ping.resolve_host")
+    @patch("nettools.core.ping._IS_WINDOWS", False)
+    @patch("subprocess.run")
+    def test_ping_without_dns_cache(self, mock_run, mock_resolve):
+        """Test the hostname is passed through when the cache is disabled."""
+        self.ping._use_icmplib = False
+        mock_run.return_value = Mock(stdout=UNIX_PING_OUTPUT, stderr="")
+
+        self.ping.ping("example.com", count=2, use_dns_cache=False)
+
+        mock_resolve.assert_not_called()
+        assert mock_run.call_args[0][0][-1] == "example.com"
+
+    def test_ping_many_icmplib(self):
+        """Test pinging several hosts with a single icmplib multiping call."""
+        self._enable_icmplib()
+        self.icmplib.multiping.return_value = [
+            SimpleNamespace(
+                packets_sent=2,
+                packets_received=2,
+                packet_loss=0.0,
+                min_rtt=1.0,
+                avg_rtt=1.5,
+                max_rtt=2.0,
+                rtts=[1.0, 2.0],
+            ),
+            SimpleNamespace(
+                packets_sent=2,
+                packets_received=0,
+                packet_loss=1.0,
+                min_rtt=0.0,
+                avg_rtt=0.0,
+                max_rtt=0.0,
+                rtts=[],
+            ),
+        ]
+
+        results = self.ping.ping_many(["10.0.0.1", "10.0.0.2"], count=2)
+
+        self.icmplib.multiping.assert_called_once()
+        assert results["10.0.0.1"]["avg_time"] == 1.5
+        assert results["10.0.0.2"]["packet_loss"] == 100.0
+
+    def test_ping_many_fallback(self):
+        """Test pinging several hosts through the per-host fallback."""
+        self.ping._use_icmplib = False
+
+        with patch.object(self.ping, "ping") as mock_ping:
+            mock_ping.side_effect = lambda host, *args, **kwargs: {"host": host}
+            results = self.ping.ping_many(["a.example", "b.example"])
+
+        assert mock_ping.call_count == 2
+        assert results == {
+            "a.example": {"host": "a.example"},
+            "b.example": {"host": "b.example"},
+        }
+
+    def test_ping_many_empty(self):
+        """Test pinging an empty host list."""
+        assert self.ping.ping_many([]) == {}
@@ -1,9 +1,61 @@
 """Tests for port checking functionality."""
 
+import asyncio
+import errno
+import selectors
 import socket
-from unittest.mock import Mock, patch
+import struct
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
-from nettools.core.ports import PortChecker
+import pytest
+
+from nettools.core.ports import COMMON_PORTS, PortChecker
+from nettools.utils.dns_cache import clear_dns_cache
+
+SOCK_CONNECT = "asyncio.selector_events.BaseSelectorEventLoop.sock_connect"
+
+
+class FakeSelector:
+    """Selector stand-in reporting every registered socket as ready at once."""
+
+    def __init__(self):
+        self.registered = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def register(self, fileobj, events, data=None):
+        self.registered[fileobj] = SimpleNamespace(fileobj=fileobj, data=data)
+
+    def unregister(self, fileobj):
+        del self.registered[fileobj]
+
+    def select(self, timeout=None):
+        ready = [key for key in self.registered.values() if key.fileobj.ready]
+        if not ready:
+            time.sleep(timeout)
+        return [(key, selectors.EVENT_WRITE) for key in ready]
+
+
+def connecting_socket(outcomes):
+    """Create a mock non-blocking socket whose connect completes per outcomes.
+
+    Ports missing from outcomes never finish connecting.
+    """
+    sock = Mock(ready=False)
+
+    def connect_ex(address):
+        sock.ready = address[1] in outcomes
+        sock.getsockopt.return_value = outcomes.get(address[1])
+        return errno.EINPROGRESS
+
+    sock.connect_ex.side_effect = connect_ex
+    return sock
 
 
 class TestPortChecker:
@@ -12,6 +64,7 @@ class TestPortChecker:
     def setup_method(self):
         """Set up test environment."""
         self.port_checker = PortChecker()
+        clear_dns_cache()
 
     @patch("socket.socket")
     def test_check_port_open(self, mock_socket_class):
@@ -53,17 +106,95 @@ class TestPortChecker:
         assert result["open"] is False
         assert "timeout" in result["error"].lower()
 
+    @patch("socket.socket")
+    def test_check_port_aborts_instead_of_lingering(self, mock_socket_class):
+        """Test probe sockets are set to reset on close."""
+        mock_socket = Mock()
+        mock_socket.connect_ex.return_value = 0
+        mock_socket_class.return_value.__enter__.return_value = mock_socket
+
+        self.port_checker.check_port("127.0.0.1", 80, timeout=2)
+
+        calls = mock_socket.setsockopt.call_args_list
+        options = {call.args[1]: call.args[2] for call in calls}
+        assert options[socket.SO_LINGER] == struct.pack("ii", 1, 0)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            assert options[socket.TCP_USER_TIMEOUT] == 2000
+
+    @patch("nettools.core.ports._KERNEL_CONNECT_TIMEOUT", True)
+    @patch("socket.socket")
+    def test_check_port_kernel_timeout(self, mock_socket_class):
+        """Test the connect is timed out by SO_SNDTIMEO where supported."""
+        mock_socket = Mock()
+        mock_socket.connect_ex.return_value = errno.EINPROGRESS
+        mock_socket_class.return_value.__enter__.return_value = mock_socket
+
+        result = self.port_checker.check_port("127.0.0.1", 443, timeout=1.5)
+
+        assert result["error"] == "Connection timeout"
+        mock_socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_SNDTIMEO, struct.pack("ll", 1, 500000)
+        )
+        mock_socket.settimeout.assert_not_called()
+
+    @patch("nettools.core.ports._KERNEL_CONNECT_TIMEOUT", False)
+    @patch("socket.socket")
+    def test_check_port_python_timeout(self, mock_socket_class):
+        """Test platforms without kernel connect timeouts use settimeout."""
+        mock_socket = Mock()
+        mock_socket.connect_ex.return_value = 0
+        mock_socket_class.return_value.__enter__.return_value = mock_socket
+
+        self.port_checker.check_port("127.0.0.1", 80, timeout=2)
+
+        mock_socket.settimeout.assert_called_once_with(2)
+
+    @patch("socket.getaddrinfo")
+    @patch("socket.socket")
+    def test_check_port_uses_dns_cache(self, mock_socket_class, mock_getaddrinfo):
+        """Test repeated checks of one host share a single lookup."""
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))
+        ]
+        mock_socket = Mock()
+        mock_socket.connect_ex.return_value = 0
+        mock_socket_class.return_value.__enter__.return_value = mock_socket
+
+        self.port_checker.check_port("example.com", 80)
+        self.port_checker.check_port("example.com", 443)
+
+        mock_getaddrinfo.assert_called_once()
+        mock_socket.connect_ex.assert_called_with(("93.184.216.34", 443))
+
+    @patch("socket.getaddrinfo")
+    @patch("socket.socket")
+    def test_check_port_ip_literal(self, mock_socket_class, mock_getaddrinfo):
+        """Test IP literals connect directly without a resolver lookup."""
+        mock_socket = Mock()
+        mock_socket.connect_ex.return_value = 0
+        mock_socket_class.return_value.__enter__.return_value = mock_socket
+
+        self.port_checker.check_port("192.0.2.10", 80)
+        self.port_checker.check_port("2001:db8::1", 443)
+
+        mock_getaddrinfo.assert_not_called()
+        families = [call.args[0] for call in mock_socket_class.call_args_list]
+        assert families == [socket.AF_INET, socket.AF_INET6]
+        mock_socket.connect_ex.assert_called_with(("2001:db8::1", 443))
+
+    @patch("selectors.DefaultSelector", new=FakeSelector)
     @patch("socket.socket")
     def test_check_ports_multiple(self, mock_socket_class):
         """Test checking multiple ports."""
-        mock_socket = Mock()
         # Mock responses: 80 open, 443 open, 8080 closed
-        mock_socket.connect_ex.side_effect = [0, 0, 111]
-        mock_socket_class.return_value.__enter__.return_value = mock_socket
-        
-        result = self.port_checker.check_ports("localhost", [80, 443, 8080])
-        
+        mock_socket_class.side_effect = lambda *args: connecting_socket(
+            {80: 0, 443: 0, 8080: 111}
+        )
+
+        result = self.port_checker.check_ports("localhost", [8080, 80, 443])
+
         assert result["host"] == "localhost"
+        assert [r["port"] for r in result["ports"]] == [8080, 80, 443]
         assert result["total_ports"] == 3
         assert result["open_ports"] == 2
         assert result["closed_ports"] == 1
@@ -72,6 +203,287 @@ class TestPortChecker:
         assert 443 in result["summary"]["open"]
         assert 8080 in result["summary"]["closed"]
 
+    @patch("selectors.DefaultSelector", new=FakeSelector)
+    @patch("socket.socket")
+    def test_check_ports_timeout(self, mock_socket_class):
+        """Test sockets that never connect time out together."""
+        mock_socket_class.side_effect = lambda *args: connecting_socket({})
+
+        result = self.port_checker.check_ports(
+            "127.0.0.1", [81, 82, 83], timeout=0.05, max_threads=2
+        )
+
+        assert result["closed_ports"] == 3
+        assert {r["error"] for r in result["ports"]} == {"Connection timeout"}
+        assert result["scan_time"] < 0.5
+
+    @patch("selectors.DefaultSelector", new=FakeSelector)
+    @patch("socket.socket")
+    def test_check_ports_nb_immediate_refusal(self, mock_socket_class):
+        """Test connects refused before the selector is consulted."""
+        sock = Mock()
+        sock.connect_ex.return_value = errno.ECONNREFUSED
+        mock_socket_class.return_value = sock
+
+        results = self.port_checker._check_ports_nb(
+            "127.0.0.1", socket.AF_INET, "127.0.0.1", [81, 82], 1, 1
+        )
+
+        assert [r["port"] for r in results] == [81, 82]
+        assert all(not r["open"] for r in results)
+        assert f"error code: {errno.ECONNREFUSED}" in results[0]["error"]
+        sock.setblocking.assert_called_with(False)
+
+    @patch("selectors.DefaultSelector", new=FakeSelector)
+    @patch("socket.socket")
+    def test_check_ports_nb_out_of_range_port(self, mock_socket_class):
+        """Test an out-of-range port fails on its own without ending the scan."""
+        sockets = []
+
+        def make_socket(*args):
+            sock = connecting_socket({80: 0})
+            connect_ex = sock.connect_ex.side_effect
+
+            def checked_connect_ex(address):
+                if address[1] > 65535:
+                    raise OverflowError("connect_ex(): port must be 0-65535.")
+                return connect_ex(address)
+
+            sock.connect_ex.side_effect = checked_connect_ex
+            sockets.append(sock)
+            return sock
+
+        mock_socket_class.side_effect = make_socket
+
+        results = self.port_checker._check_ports_nb(
+            "127.0.0.1", socket.AF_INET, "127.0.0.1", [70000, 80], 1, 1
+        )
+
+        assert [r["port"] for r in results] == [70000, 80]
+        assert results[0]["open"] is False
+        assert "port must be 0-65535" in results[0]["error"]
+        assert results[1]["open"] is True
+        for sock in sockets:
+            sock.close.assert_called_once()
+
+    @patch("selectors.DefaultSelector", new=FakeSelector)
+    @patch("socket.socket")
+    def test_check_ports_aborts_instead_of_lingering(self, mock_socket_class):
+        """Test every socket of a multi-port scan is set to reset on close."""
+        sockets = []
+
+        def make_socket(*args):
+            sock = connecting_socket({81: 111, 82: 111})
+            sockets.append(sock)
+            return sock
+
+        mock_socket_class.side_effect = make_socket
+
+        self.port_checker.check_ports("127.0.0.1", [81, 82])
+
+        assert len(sockets) == 2
+        for sock in sockets:
+            sock.setsockopt.assert_any_call(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            sock.close.assert_called_once()
+
+    @patch("socket.socket")
+    def test_check_ports_thread(self, mock_socket_class):
+        """Test thread pool scans keep results in port order."""
+        mock_socket = Mock()
+        # Ports finish in any order, so look outcomes up instead of listing them
+        mock_socket.connect_ex.side_effect = lambda addr: {80: 0, 443: 0, 8080: 111}[
+            addr[1]
+        ]
+        mock_socket_class.return_value.__enter__.return_value = mock_socket
+
+        result = self.port_checker.check_ports(
+            "127.0.0.1", [8080, 80, 443], method="thread"
+        )
+
+        assert [r["port"] for r in result["ports"]] == [8080, 80, 443]
+        assert result["summary"]["open"] == [80, 443]
+        assert result["summary"]["closed"] == [8080]
+
+    @patch("socket.getaddrinfo")
+    def test_check_ports_resolves_once(self, mock_getaddrinfo):
+        """Test the host is resolved once and the address used for every port."""
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))
+        ]
+        probed = []
+
+        async def check_port(host, port, timeout, family):
+            probed.append(host)
+            return {"port": port, "open": True, "response_time": 0.0, "error": None}
+
+        with patch.object(self.port_checker, "_check_port_async", check_port):
+            result = asyncio.run(
+                self.port_checker.check_ports_async("example.com", [80, 443])
+            )
+
+        mock_getaddrinfo.assert_called_once()
+        assert probed == ["93.184.216.34", "93.184.216.34"]
+        assert result["host"] == "example.com"
+
+    @patch("socket.getaddrinfo")
+    @patch("socket.socket")
+    def test_check_ports_dns_failure(self, mock_socket_class, mock_getaddrinfo):
+        """Test an unresolvable host fails every port without connecting."""
+        mock_getaddrinfo.side_effect = socket.gaierror("Name or service not known")
+
+        result = self.port_checker.check_ports("invalid.host", [80, 443])
+
+        mock_socket_class.assert_not_called()
+        assert result["closed_ports"] == 2
+        assert "DNS resolution failed" in result["ports"][0]["error"]
+        assert len(result["summary"]["errors"]) == 2
+
+    @patch("nettools.utils.tcp_syn.scan")
+    @patch("nettools.utils.tcp_syn.is_available", return_value=True)
+    def test_check_ports_syn(self, _mock_available, mock_scan):
+        """Test SYN scan replies are mapped onto port results."""
+        mock_scan.return_value = {22: (True, 0.001), 80: (False, 0.002)}
+
+        result = self.port_checker.check_ports(
+            "127.0.0.1", [22, 80, 443], method="syn"
+        )
+
+        mock_scan.assert_called_once_with("127.0.0.1", [22, 80, 443], 5)
+        assert result["summary"]["open"] == [22]
+        assert result["summary"]["closed"] == [80, 443]
+        assert "error code" in result["ports"][1]["error"]
+        assert result["ports"][2]["error"] == "Connection timeout"
+
+    @patch("nettools.utils.tcp_syn.scan")
+    @patch("nettools.utils.tcp_syn.is_available", return_value=True)
+    def test_check_ports_syn_invalid_port(self, _mock_available, mock_scan):
+        """Test out-of-range ports fail on their own in a SYN scan."""
+        mock_scan.return_value = {22: (True, 0.001)}
+
+        result = self.port_checker.check_ports("127.0.0.1", [70000, 22], method="syn")
+
+        mock_scan.assert_called_once_with("127.0.0.1", [22], 5)
+        assert [r["port"] for r in result["ports"]] == [70000, 22]
+        assert result["ports"][0]["open"] is False
+        assert "port must be 0-65535" in result["ports"][0]["error"]
+        assert result["summary"]["open"] == [22]
+
+    @patch("selectors.DefaultSelector", new=FakeSelector)
+    @patch("socket.socket")
+    @patch("nettools.utils.tcp_syn.is_available", return_value=False)
+    def test_check_ports_syn_falls_back(self, _mock_available, mock_socket_class):
+        """Test SYN scans fall back to connects without raw socket access."""
+        mock_socket_class.side_effect = lambda *args: connecting_socket({80: 0})
+
+        result = self.port_checker.check_ports("127.0.0.1", [80], method="syn")
+
+        assert result["summary"]["open"] == [80]
+
+    def test_check_ports_unknown_method(self):
+        """Test an unknown scan method is rejected."""
+        with pytest.raises(ValueError, match="Unknown scan method"):
+            self.port_checker.check_ports("127.0.0.1", [80], method="udp")
+
+    @patch(SOCK_CONNECT, new_callable=AsyncMock)
+    def test_check_ports_async(self, mock_sock_connect):
+        """Test checking multiple ports on the event loop."""
+
+        async def sock_connect(sock, address):
+            if address[1] == 8080:
+                raise ConnectionRefusedError(111, "Connection refused")
+
+        mock_sock_connect.side_effect = sock_connect
+
+        result = asyncio.run(
+            self.port_checker.check_ports_async("127.0.0.1", [443, 80, 8080])
+        )
+
+        assert result["total_ports"] == 3
+        assert result["open_ports"] == 2
+        assert result["closed_ports"] == 1
+        assert [r["port"] for r in result["ports"]] == [443, 80, 8080]
+        assert result["summary"]["open"] == [443, 80]
+        assert result["summary"]["closed"] == [8080]
+        assert "error code: 111" in result["ports"][2]["error"]
+
+    @patch(SOCK_CONNECT, new_callable=AsyncMock)
+    def test_acheck_port_open(self, mock_sock_connect):
+        """Test an async single-port check closes the socket it connected."""
+        result = asyncio.run(self.port_checker.acheck_port("127.0.0.1", 80))
+
+        mock_sock_connect.assert_awaited_once()
+        sock, address = mock_sock_connect.call_args.args
+        assert address == ("127.0.0.1", 80)
+        assert sock.fileno() == -1
+        assert result["open"] is True
+        assert result["error"] is None
+
+    @patch(SOCK_CONNECT, new_callable=AsyncMock)
+    def test_acheck_port_refused(self, mock_sock_connect):
+        """Test an async single-port check reports refused connections."""
+        mock_sock_connect.side_effect = ConnectionRefusedError(
+            111, "Connection refused"
+        )
+
+        result = asyncio.run(self.port_checker.acheck_port("127.0.0.1", 8080))
+
+        assert result["open"] is False
+        assert result["error"] == "Connection failed (error code: 111)"
+
+    @patch("nettools.core.ports.resolve")
+    def test_acheck_port_dns_failure(self, mock_resolve):
+        """Test an async single-port check reports names that do not resolve."""
+        mock_resolve.side_effect = socket.gaierror(-2, "Name or service not known")
+
+        result = asyncio.run(self.port_checker.acheck_port("nonexistent.invalid", 80))
+
+        assert result["open"] is False
+        assert "DNS resolution failed" in result["error"]
+
+    def test_acheck_port_out_of_range(self):
+        """Test an async single-port check reports out-of-range ports."""
+        result = asyncio.run(self.port_checker.acheck_port("127.0.0.1", 70000))
+
+        assert result["open"] is False
+        assert "port must be 0-65535" in result["error"]
+
+    @patch(SOCK_CONNECT, new_callable=AsyncMock)
+    def test_check_ports_async_timeout(self, mock_sock_connect):
+        """Test async port checks report timeouts."""
+
+        async def sock_connect(sock, address):
+            await asyncio.sleep(1)
+
+        mock_sock_connect.side_effect = sock_connect
+
+        result = asyncio.run(
+            self.port_checker.check_ports_async("127.0.0.1", [81], timeout=0.01)
+        )
+
+        assert result["closed_ports"] == 1
+        assert result["ports"][0]["error"] == "Connection timeout"
+        assert result["summary"]["errors"] == []
+
+    @patch(SOCK_CONNECT, new_callable=AsyncMock)
+    def test_check_ports_async_out_of_range_port(self, mock_sock_connect):
+        """Test an out-of-range port fails on its own without ending the scan."""
+
+        async def sock_connect(sock, address):
+            if address[1] > 65535:
+                raise OverflowError("connect(): port must be 0-65535.")
+
+        mock_sock_connect.side_effect = sock_connect
+
+        result = asyncio.run(
+            self.port_checker.check_ports_async("127.0.0.1", [70000, 80])
+        )
+
+        assert result["summary"]["open"] == [80]
+        assert result["ports"][0]["open"] is False
+        assert "port must be 0-65535" in result["ports"][0]["error"]
+
     def test_check_service_known(self):
         """Test checking a known service."""
         with patch.object(self.port_checker, "check_port") as mock_check:
@@ -114,6 +526,7 @@ class TestPortChecker:
             # Verify common ports are included
             args = mock_check_ports.call_args[0]
             ports = args[1]
+            assert ports is COMMON_PORTS
             assert 80 in ports  # HTTP
             assert 443 in ports  # HTTPS
             assert 22 in ports  # SSH
\ No newline at end of file
@@ -1,5 +1,9 @@
 """Tests for system information utilities."""
 
+import subprocess
+import sys
+import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from nettools.core.sysinfo import SystemInfo
@@ -10,6 +14,8 @@ class TestSystemInfo:
 
     def setup_method(self):
         """Set up test environment."""
+        SystemInfo._cache.clear()
+        SystemInfo._disk_probes.clear()
         self.sysinfo = SystemInfo()
 
     def test_get_platform_info(self):
@@ -42,6 +48,24 @@ class TestSystemInfo:
         assert result["count"] == 8
         assert result["usage"] == 35.5
 
+    @patch("time.sleep")
+    def test_get_cpu_info_does_not_block(self, mock_sleep, mock_psutil):
+        """Test CPU usage is read without psutil's blocking interval."""
+        self.sysinfo._cpu_sampled_at -= 1.0
+
+        self.sysinfo.get_cpu_info()
+
+        mock_sleep.assert_not_called()
+        mock_psutil["cpu_percent"].assert_called_once_with(interval=None)
+
+    @patch("time.sleep")
+    def test_get_cpu_info_waits_for_minimum_interval(self, mock_sleep, mock_psutil):
+        """Test a sample taken right after the previous one waits briefly."""
+        self.sysinfo.get_cpu_info(interval=0.5)
+
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 0.5
+
     def test_get_memory_info(self, mock_psutil):
         """Test getting memory information."""
         memory_mock = mock_psutil["virtual_memory"].return_value
@@ -59,19 +83,17 @@ class TestSystemInfo:
 
     def test_get_disk_info(self, mock_psutil):
         """Test getting disk information."""
-        # Mock disk partition
-        partition_mock = Mock()
-        partition_mock.device = "/dev/sda1"
-        partition_mock.mountpoint = "/"
-        partition_mock.fstype = "ext4"
-        mock_psutil["disk_partitions"].return_value = [partition_mock]
-
-        # Mock disk usage
-        usage_mock = Mock()
-        usage_mock.total = 1000000000  # 1GB
-        usage_mock.used = 500000000  # 500MB
-        usage_mock.free = 500000000  # 500MB
-        mock_psutil["disk_usage"].return_value = usage_mock
+        # Fake disk partition and usage; plain attribute holders are enough
+        # since nothing is asserted on them
+        partition = SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4")
+        mock_psutil["disk_partitions"].return_value = [partition]
+
+        usage = SimpleNamespace(
+            total=1000000000,  # 1GB
+            used=500000000,  # 500MB
+            free=500000000,  # 500MB
+        )
+        mock_psutil["disk_usage"].return_value = usage
 
         result = self.sysinfo.get_disk_info()
 
@@ -85,7 +107,163 @@ class TestSystemInfo:
         assert partition["free"] == 500000000
         assert partition["percent"] == 50.0
 
-    def test_get_uptime(self, mock_psutil):
+    def test_get_disk_info_skips_slow_mounts(self, mock_psutil):
+        """Test a mount that does not answer in time is left out."""
+        fast = SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4")
+        slow = SimpleNamespace(
+            device="nfs:/export", mountpoint="/mnt/nfs", fstype="nfs"
+        )
+        mock_psutil["disk_partitions"].return_value = [slow, fast]
+        released = threading.Event()
+
+        def disk_usage(mountpoint):
+            if mountpoint == "/mnt/nfs":
+                released.wait(5)
+            return SimpleNamespace(total=100, used=25, free=75)
+
+        mock_psutil["disk_usage"].side_effect = disk_usage
+
+        with patch("nettools.core.sysinfo.DISK_USAGE_TIMEOUT", 0.05):
+            result = self.sysinfo.get_disk_info()
+        released.set()
+
+        assert [p["mountpoint"] for p in result["partitions"]] == ["/"]
+        assert result["summary"]["percent"] == 25.0
+
+    def test_get_disk_info_does_not_pile_up_on_hung_mounts(self, mock_psutil):
+        """Test a mount still being read is not read again by later calls."""
+        fast = SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4")
+        hung = SimpleNamespace(
+            device="nfs:/export", mountpoint="/mnt/nfs", fstype="nfs"
+        )
+        mock_psutil["disk_partitions"].return_value = [hung, fast]
+        released = threading.Event()
+        reads = []
+
+        def disk_usage(mountpoint):
+            reads.append(mountpoint)
+            if mountpoint == "/mnt/nfs":
+                released.wait(5)
+            return SimpleNamespace(total=100, used=25, free=75)
+
+        mock_psutil["disk_usage"].side_effect = disk_usage
+
+        with patch("nettools.core.sysinfo.DISK_USAGE_TIMEOUT", 0.05):
+            for _ in range(3):
+                result = self.sysinfo.get_disk_info()
+        released.set()
+
+        assert reads.count("/mnt/nfs") == 1
+        assert reads.count("/") == 3
+        assert [p["mountpoint"] for p in result["partitions"]] == ["/"]
+
+    def test_get_disk_info_hung_mount_does_not_block_exit(self):
+        """Test a lookup that never returns does not keep the process alive."""
+        script = """
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import psutil
+
+from nettools.core import sysinfo
+
+hung = SimpleNamespace(device="nfs:/export", mountpoint="/mnt/nfs", fstype="nfs")
+with patch.object(psutil, "disk_partitions", return_value=[hung]), patch.object(
+    psutil, "disk_usage", side_effect=lambda mountpoint: time.sleep(60)
+), patch.object(sysinfo, "DISK_USAGE_TIMEOUT", 0.05):
+    print(sysinfo.SystemInfo().get_disk_info())
+"""
+
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=20,
+            check=True,
+        )
+
+        assert "'partitions': []" in completed.stdout
+
+    def test_get_network_info_cached(self, mock_psutil):
+        """Test network details are reused for repeated calls."""
+        mock_psutil["net_if_addrs"].return_value = {"lo": []}
+        mock_psutil["net_if_stats"].return_value = {}
+
+        first = self.sysinfo.get_network_info()
+        first["interfaces"][0]["name"] = "changed"
+        second = self.sysinfo.get_network_info()
+
+        assert second["interfaces"][0]["name"] == "lo"
+        second["interfaces"].clear()
+        assert self.sysinfo.get_network_info()["interfaces"][0]["name"] == "lo"
+        mock_psutil["net_if_addrs"].assert_called_once()
+
+        self.sysinfo._net_cache = (0.0, first)
+        self.sysinfo.get_network_info()
+        assert mock_psutil["net_if_addrs"].call_count == 2
+
+    def test_get_disk_info_caches_partitions(self, mock_psutil):
+        """Test the partition list is reused while usage is read each time."""
+        mock_psutil["disk_partitions"].return_value = [
+            SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4")
+        ]
+        mock_psutil["disk_usage"].return_value = SimpleNamespace(
+            total=100, used=50, free=50
+        )
+
+        self.sysinfo.get_disk_info()
+        self.sysinfo.get_disk_info()
+
+        mock_psutil["disk_partitions"].assert_called_once()
+        assert mock_psutil["disk_usage"].call_count == 2
+
+    def test_cache_shared_between_instances(self, mock_psutil):
+        """Test platform details and partitions are reused by new instances."""
+        mock_psutil["disk_partitions"].return_value = []
+
+        with patch("nettools.core.sysinfo.get_platform_info") as mock_get_platform_info:
+            mock_get_platform_info.return_value = {
+                "platform": "linux",
+                "system": "Linux",
+                "architecture": "64bit",
+                "node": "test-host",
+                "release": "5.4.0",
+                "version": "#48-Ubuntu",
+                "machine": "x86_64",
+                "processor": "x86_64",
+            }
+
+            self.sysinfo.get_platform_info()["hostname"] = "changed"
+            self.sysinfo.get_disk_info()
+            other = SystemInfo()
+
+            assert other.get_platform_info()["hostname"] == "test-host"
+            other.get_disk_info()
+
+        mock_get_platform_info.assert_called_once()
+        mock_psutil["disk_partitions"].assert_called_once()
+
+    @patch("time.sleep")
+    @patch("psutil.process_iter")
+    def test_get_processes(self, mock_process_iter, mock_sleep):
+        """Test processes are primed, sampled once and sorted by CPU usage."""
+        idle = Mock()
+        idle.as_dict.return_value = {"pid": 1, "name": "init", "cpu_percent": 0.0}
+        busy = Mock()
+        busy.as_dict.return_value = {"pid": 2, "name": "busy", "cpu_percent": 90.0}
+        mock_process_iter.return_value = [idle, busy]
+
+        result = self.sysinfo.get_processes(limit=1)
+
+        mock_sleep.assert_called_once()
+        idle.cpu_percent.assert_called_once_with()
+        busy.as_dict.assert_called_once()
+        assert result["total_processes"] == 2
+        assert [p["name"] for p in result["top_processes"]] == ["busy"]
+
+    @patch("nettools.core.sysinfo.is_linux", return_value=False)
+    def test_get_uptime(self, _mock_is_linux, mock_psutil):
         """Test getting system uptime."""
         with patch("time.time") as mock_time:
             mock_time.return_value = 1234567890 + 86400  # 1 day later
@@ -95,8 +273,41 @@ class TestSystemInfo:
 
             assert "1 day" in result
 
+    @patch("nettools.core.sysinfo.is_linux", return_value=False)
+    def test_get_uptime_formatting(self, _mock_is_linux, mock_psutil):
+        """Test uptime parts are pluralized and zero parts left out."""
+        mock_psutil["boot_time"].return_value = 1000000000
+        with patch("time.time") as mock_time:
+            mock_time.return_value = 1000000000 + 2 * 86400 + 60
+            assert self.sysinfo.get_uptime() == "2 days, 1 minute"
+
+            mock_time.return_value = 1000000000 + 30
+            assert self.sysinfo.get_uptime() == "less than a minute"
+
+    @patch("nettools.core.sysinfo.is_linux", return_value=True)
+    def test_get_uptime_linux(self, _mock_is_linux, mock_psutil, tmp_path):
+        """Test Linux reads the uptime from /proc without psutil."""
+        uptime = tmp_path / "uptime"
+        uptime.write_text("7260.00 10000.00\n")
+
+        with patch("nettools.core.sysinfo._PROC_UPTIME", str(uptime)):
+            assert self.sysinfo.get_uptime() == "2 hours, 1 minute"
+
+        mock_psutil["boot_time"].assert_not_called()
+
+    @patch("nettools.core.sysinfo.is_linux", return_value=True)
+    def test_get_uptime_linux_fallback(self, _mock_is_linux, mock_psutil, tmp_path):
+        """Test an unreadable /proc/uptime falls back to psutil."""
+        mock_psutil["boot_time"].return_value = 1000000000
+        with (
+            patch("nettools.core.sysinfo._PROC_UPTIME", str(tmp_path / "missing")),
+            patch("time.time", return_value=1000000000 + 86400),
+        ):
+            assert self.sysinfo.get_uptime() == "1 day"
+
+    @patch.object(SystemInfo, "_read_proc_snapshot", return_value=None)
     @patch("nettools.core.sysinfo.get_platform_info")
-    def test_get_all_info(self, mock_get_platform_info, mock_psutil):
+    def test_get_all_info(self, mock_get_platform_info, _mock_snapshot, mock_psutil):
         """Test getting all system information."""
         mock_get_platform_info.return_value = {
             "platform": "linux",
@@ -125,3 +336,37 @@ class TestSystemInfo:
             assert "uptime" in result
             assert "timestamp" in result
             assert result["platform"] == "linux"
+
+    @patch("nettools.core.sysinfo.is_linux", return_value=True)
+    def test_read_proc_snapshot(self, _mock_is_linux, tmp_path):
+        """Test memory and uptime are parsed from /proc files."""
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_text(
+            "MemTotal:        1000 kB\n"
+            "MemFree:          200 kB\n"
+            "MemAvailable:     600 kB\n"
+            "SwapTotal:        400 kB\n"
+            "SwapFree:         300 kB\n"
+        )
+        uptime = tmp_path / "uptime"
+        uptime.write_text("90061.52 170000.00\n")
+
+        with (
+            patch("nettools.core.sysinfo._PROC_MEMINFO", str(meminfo)),
+            patch("nettools.core.sysinfo._PROC_UPTIME", str(uptime)),
+        ):
+            snapshot = self.sysinfo._read_proc_snapshot()
+
+        assert snapshot.memory.total == 1000 * 1024
+        assert snapshot.memory.used == 400 * 1024
+        assert snapshot.memory.percent == 40.0
+        assert snapshot.swap.used == 100 * 1024
+        assert snapshot.swap.percent == 25.0
+        assert self.sysinfo._format_uptime(snapshot.uptime) == (
+            "1 day, 1 hour, 1 minute"
+        )
+
+    @patch("nettools.core.sysinfo.is_linux", return_value=False)
+    def test_read_proc_snapshot_not_linux(self, _mock_is_linux):
+        """Test other platforms leave the figures to psutil."""
+        assert self.sysinfo._read_proc_snapshot() is None
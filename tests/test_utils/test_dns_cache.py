@@ -0,0 +1,91 @@
+"""Tests for the DNS resolution cache."""
+
+import socket
+from unittest.mock import patch
+
+from nettools.utils import dns_cache
+from nettools.utils.dns_cache import clear_dns_cache, resolve, resolve_host
+
+
+def _addrinfo(address):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 0))]
+
+
+class TestDNSCache:
+    """Test cases for DNS cache functionality."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        clear_dns_cache()
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        clear_dns_cache()
+
+    @patch("socket.getaddrinfo")
+    def test_resolve_caches_answer(self, mock_getaddrinfo):
+        """Test repeated lookups are served from the cache."""
+        mock_getaddrinfo.return_value = _addrinfo("93.184.216.34")
+
+        assert resolve("example.com") == "93.184.216.34"
+        assert resolve("example.com") == "93.184.216.34"
+        mock_getaddrinfo.assert_called_once()
+
+    @patch("time.monotonic")
+    @patch("socket.getaddrinfo")
+    def test_resolve_expires_entries(self, mock_getaddrinfo, mock_monotonic):
+        """Test entries are looked up again once their TTL has passed."""
+        mock_getaddrinfo.side_effect = [
+            _addrinfo("93.184.216.34"),
+            _addrinfo("93.184.216.35"),
+        ]
+        mock_monotonic.return_value = 1000.0
+        assert resolve("example.com", ttl=60) == "93.184.216.34"
+
+        mock_monotonic.return_value = 1061.0
+        assert resolve("example.com", ttl=60) == "93.184.216.35"
+        assert mock_getaddrinfo.call_count == 2
+
+    @patch("socket.getaddrinfo")
+    def test_resolve_evicts_least_recently_used(self, mock_getaddrinfo):
+        """Test the cache stays within its size bound."""
+        mock_getaddrinfo.side_effect = lambda host, *args, **kwargs: _addrinfo(
+            "10.0.0.1"
+        )
+
+        with patch.object(dns_cache, "MAX_ENTRIES", 2):
+            resolve("a.example")
+            resolve("b.example")
+            resolve("a.example")
+            resolve("c.example")
+
+        assert [host for host, _ in dns_cache._cache] == ["a.example", "c.example"]
+
+    @patch("socket.getaddrinfo")
+    def test_resolve_caches_per_family(self, mock_getaddrinfo):
+        """Test answers for different address families are cached apart."""
+        mock_getaddrinfo.side_effect = [
+            _addrinfo("93.184.216.34"),
+            [(socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2606:2800::1", 0, 0, 0))],
+        ]
+
+        assert resolve("example.com", socket.AF_INET) == "93.184.216.34"
+        assert resolve("example.com", socket.AF_INET6) == "2606:2800::1"
+        assert resolve("example.com", socket.AF_INET) == "93.184.216.34"
+        assert mock_getaddrinfo.call_count == 2
+
+    @patch("socket.getaddrinfo")
+    def test_resolve_host_falls_back_to_name(self, mock_getaddrinfo):
+        """Test unresolvable hosts are returned unchanged."""
+        mock_getaddrinfo.side_effect = socket.gaierror("Name or service not known")
+
+        assert resolve_host("invalid.host") == "invalid.host"
+
+    @patch("socket.getaddrinfo")
+    def test_resolve_host_keeps_name_for_ipv6(self, mock_getaddrinfo):
+        """Test hosts resolving to IPv6 are handed on by name."""
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 0, 0, 0))
+        ]
+
+        assert resolve_host("localhost6") == "localhost6"
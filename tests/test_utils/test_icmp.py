@@ -0,0 +1,109 @@
+"""Tests for unprivileged ICMP echo."""
+
+import struct
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nettools.utils import icmp
+
+
+def _reply(ident, sequence):
+    header = struct.pack("!BBHHH", icmp.ICMP_ECHO_REPLY, 0, 0, ident, sequence)
+    return header + bytes(56)
+
+
+class TestICMP:
+    """Test cases for ICMP echo functionality."""
+
+    def test_checksum(self):
+        """Test the internet checksum of a known packet."""
+        # Echo request, identifier 1, sequence 1, no payload
+        packet = struct.pack("!BBHHH", 8, 0, 0, 1, 1)
+        assert icmp.checksum(packet) == 0xF7FD
+
+    def test_build_echo_request_checksum_verifies(self):
+        """Test a built request checksums to zero including its checksum."""
+        packet = icmp.build_echo_request(0x1234, 7, b"abc")
+
+        assert packet[0] == icmp.ICMP_ECHO_REQUEST
+        assert icmp.checksum(packet) == 0
+
+    def test_parse_echo_reply(self):
+        """Test parsing replies with and without a leading IPv4 header."""
+        reply = _reply(0x1234, 3)
+        ip_header = bytes([0x45]) + bytes(19)
+
+        assert icmp.parse_echo_reply(reply) == (0x1234, 3)
+        assert icmp.parse_echo_reply(ip_header + reply) == (0x1234, 3)
+
+    def test_parse_echo_reply_ignores_other_types(self):
+        """Test non-reply ICMP messages are ignored."""
+        unreachable = struct.pack("!BBHHH", 3, 1, 0, 0, 0)
+
+        assert icmp.parse_echo_reply(unreachable) is None
+        assert icmp.parse_echo_reply(b"\x00") is None
+
+    @patch("socket.socket")
+    def test_is_available(self, mock_socket):
+        """Test availability reflects whether the socket can be opened."""
+        assert icmp.is_available() is True
+
+        mock_socket.side_effect = PermissionError("Permission denied")
+        assert icmp.is_available() is False
+
+    @patch("select.select")
+    @patch("socket.gethostbyname", return_value="10.0.0.1")
+    @patch("socket.socket")
+    def test_echo(self, mock_socket, _mock_gethostbyname, mock_select):
+        """Test replies are matched by sequence number and timed."""
+        sock = MagicMock()
+        mock_socket.return_value.__enter__.return_value = sock
+        sock.recv.side_effect = [_reply(0, 1), _reply(0, 2)]
+        mock_select.side_effect = lambda r, w, x, t: (r, [], [])
+
+        with patch.object(icmp, "_KERNEL_SETS_IDENT", True):
+            times = icmp.echo("example.com", count=2, timeout=1)
+
+        assert len(times) == 2
+        assert sock.sendto.call_count == 2
+        assert sock.sendto.call_args[0][1] == ("10.0.0.1", 0)
+
+    @patch("select.select", return_value=([], [], []))
+    @patch("socket.gethostbyname", return_value="10.0.0.1")
+    @patch("socket.socket")
+    def test_echo_timeout(self, mock_socket, _mock_gethostbyname, _mock_select):
+        """Test unanswered requests produce no round-trip times."""
+        sock = MagicMock()
+        mock_socket.return_value.__enter__.return_value = sock
+
+        assert icmp.echo("10.0.0.1", count=3, timeout=1) == []
+        assert sock.sendto.call_count == 3
+
+    @patch("select.select")
+    @patch("socket.socket")
+    def test_echo_keeps_replies_after_failure(self, mock_socket, mock_select):
+        """Test a later failed request is counted as lost, not fatal."""
+        sock = MagicMock()
+        mock_socket.return_value.__enter__.return_value = sock
+        sock.sendto.side_effect = [None, OSError("Network is unreachable"), None]
+        sock.recv.side_effect = [_reply(0, 1), _reply(0, 3)]
+        mock_select.side_effect = lambda r, w, x, t: (r, [], [])
+
+        with patch.object(icmp, "_KERNEL_SETS_IDENT", True):
+            times = icmp.echo("10.0.0.1", count=3, timeout=1)
+
+        assert len(times) == 2
+        assert sock.sendto.call_count == 3
+
+    @patch("socket.socket")
+    def test_echo_first_request_failure(self, mock_socket):
+        """Test a failing first request is raised for the caller to fall back."""
+        sock = MagicMock()
+        mock_socket.return_value.__enter__.return_value = sock
+        sock.sendto.side_effect = OSError("Network is unreachable")
+
+        with pytest.raises(OSError):
+            icmp.echo("10.0.0.1", count=3, timeout=1)
+
+        sock.sendto.assert_called_once()
@@ -0,0 +1,47 @@
+"""Tests for logging utilities."""
+
+import io
+import logging
+from unittest.mock import patch
+
+from nettools.utils.logger import _BufferedStreamHandler, get_logger
+
+
+class TestLogger:
+    """Test cases for logger configuration."""
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        get_logger.cache_clear()
+
+    def test_get_logger_cached(self):
+        """Test repeated lookups return the same configured logger."""
+        logger = get_logger("test-cached")
+
+        assert get_logger("test-cached") is logger
+        assert len(logger.handlers) == 1
+
+    def test_get_logger_handler_for_tty(self):
+        """Test interactive output keeps the per-record flushing handler."""
+        with patch("sys.stdout.isatty", return_value=True):
+            logger = get_logger("test-tty")
+
+        assert type(logger.handlers[0]) is logging.StreamHandler
+
+    def test_get_logger_handler_for_pipe(self):
+        """Test piped output uses the non-flushing handler."""
+        with patch("sys.stdout.isatty", return_value=False):
+            logger = get_logger("test-pipe")
+
+        assert isinstance(logger.handlers[0], _BufferedStreamHandler)
+
+    def test_buffered_handler_does_not_flush(self):
+        """Test records are written without flushing the stream."""
+        stream = io.StringIO()
+        handler = _BufferedStreamHandler(stream)
+
+        with patch.object(stream, "flush") as mock_flush:
+            handler.emit(logging.makeLogRecord({"msg": "hello"}))
+
+        mock_flush.assert_not_called()
+        assert stream.getvalue() == "hello\n"
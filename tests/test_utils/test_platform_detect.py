@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+from nettools.utils import platform_detect
 from nettools.utils.platform_detect import (
     PlatformType,
     get_platform,
@@ -16,6 +17,18 @@ from nettools.utils.platform_detect import (
 class TestPlatformDetect:
     """Test cases for platform detection functionality."""
 
+    def setup_method(self):
+        """Set up test environment."""
+        get_platform.cache_clear()
+        get_shell_command_prefix.cache_clear()
+        platform_detect._platform_info.cache_clear()
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        get_platform.cache_clear()
+        get_shell_command_prefix.cache_clear()
+        platform_detect._platform_info.cache_clear()
+
     @patch("platform.system")
     def test_get_platform_linux(self, mock_system):
         """Test platform detection for Linux."""
@@ -101,6 +114,25 @@ class TestPlatformDetect:
         assert info["architecture"] == "64bit"
         assert info["node"] == "test-host"
 
+    @patch("platform.system")
+    def test_get_platform_cached(self, mock_system):
+        """Test the platform is detected only once."""
+        mock_system.return_value = "Linux"
+
+        assert get_platform() == PlatformType.LINUX
+        assert is_linux() is True
+        assert is_windows() is False
+        mock_system.assert_called_once()
+
+    @patch("platform.processor", return_value="x86_64")
+    def test_get_platform_info_cached(self, mock_processor):
+        """Test platform details are collected once and returned as copies."""
+        info = get_platform_info()
+        info["processor"] = "changed"
+
+        assert get_platform_info()["processor"] == "x86_64"
+        mock_processor.assert_called_once()
+
     @patch("platform.system")
     def test_get_shell_command_prefix_windows(self, mock_system):
         """Test shell command prefix for Windows."""
@@ -114,3 +146,8 @@ class TestPlatformDetect:
         mock_system.return_value = "Linux"
         prefix = get_shell_command_prefix()
         assert prefix == ("sh", "-c")
+
+    @patch("platform.system", return_value="Linux")
+    def test_get_shell_command_prefix_cached(self, _mock_system):
+        """Test the same prefix tuple is returned on every call."""
+        assert get_shell_command_prefix() is get_shell_command_prefix()
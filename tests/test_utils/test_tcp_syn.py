@@ -0,0 +1,71 @@
+"""Tests for TCP SYN port scanning."""
+
+import socket
+import struct
+from unittest.mock import MagicMock, patch
+
+from nettools.utils import tcp_syn
+from nettools.utils.icmp import checksum
+
+
+def _reply(source, port, destination_port, ack, flags):
+    ip_header = bytes([0x45]) + bytes(8) + bytes([socket.IPPROTO_TCP]) + bytes(2)
+    ip_header += socket.inet_aton(source) + socket.inet_aton("10.0.0.2")
+    tcp_header = struct.pack(
+        "!HHIIBBHHH", port, destination_port, 0, ack, 5 << 4, flags, 0, 0, 0
+    )
+    return ip_header + tcp_header
+
+
+class TestTCPSyn:
+    """Test cases for SYN scan functionality."""
+
+    def test_build_syn(self):
+        """Test the SYN segment carries its flags and a valid checksum."""
+        segment = tcp_syn.build_syn("10.0.0.2", "10.0.0.1", 40000, 443, 1234)
+        pseudo_header = (
+            socket.inet_aton("10.0.0.2")
+            + socket.inet_aton("10.0.0.1")
+            + struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(segment))
+        )
+
+        assert struct.unpack_from("!HHI", segment) == (40000, 443, 1234)
+        assert segment[13] == tcp_syn.TCP_SYN
+        assert checksum(pseudo_header + segment) == 0
+
+    def test_parse_reply(self):
+        """Test replies are parsed and non-TCP packets ignored."""
+        reply = _reply("10.0.0.1", 443, 40000, 1235, tcp_syn.TCP_SYN | tcp_syn.TCP_ACK)
+
+        assert tcp_syn.parse_reply(reply) == ("10.0.0.1", 443, 40000, 1235, 0x12)
+        assert tcp_syn.parse_reply(b"\x45" + bytes(30)) is None
+
+    @patch("select.select")
+    @patch("random.getrandbits", return_value=1234)
+    @patch("random.randint", return_value=40000)
+    @patch("nettools.utils.tcp_syn.source_address", return_value="10.0.0.2")
+    @patch("socket.socket")
+    def test_scan(self, mock_socket, _mock_source, _mock_port, _mock_seq, mock_select):
+        """Test SYN-ACK replies are open, RSTs closed and silence omitted."""
+        sock = MagicMock()
+        mock_socket.return_value.__enter__.return_value = sock
+        sock.recv.side_effect = [
+            _reply("10.0.0.1", 22, 40000, 1235, tcp_syn.TCP_SYN | tcp_syn.TCP_ACK),
+            _reply("10.0.0.9", 80, 40000, 1235, tcp_syn.TCP_RST),  # other host
+            _reply("10.0.0.1", 80, 40000, 1235, tcp_syn.TCP_RST | tcp_syn.TCP_ACK),
+        ]
+        mock_select.side_effect = [([sock], [], [])] * 3 + [([], [], [])]
+
+        replies = tcp_syn.scan("10.0.0.1", [22, 80, 443], timeout=1)
+
+        assert sock.sendto.call_count == 3
+        assert replies[22][0] is True
+        assert replies[80][0] is False
+        assert 443 not in replies
+
+    @patch("socket.socket")
+    def test_is_available(self, mock_socket):
+        """Test availability reflects whether a raw socket can be opened."""
+        mock_socket.side_effect = PermissionError("Operation not permitted")
+
+        assert tcp_syn.is_available() is False